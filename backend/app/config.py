@@ -1,18 +1,22 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
 
 class Settings(BaseSettings):
     database_url: str = "postgresql://nakbase:nakbase_secret@db:5432/nakbase"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle: int = 1800  # 秒
     redis_url: str = "redis://redis:6379/0"
     secret_key: str = "your-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 24  # 24時間
     storage_path: str = "/storage"
     debug_mode: bool = False
+    run_migrations: bool = True  # 起動時に拡張作成・Alembicマイグレーションを実行するか
 
-    class Config:
-        env_file = ".env"
+    # .env はプロセス起動時に get_settings() で1度だけ読み込む（以降はキャッシュ）
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", frozen=True)
 
 
 @lru_cache()
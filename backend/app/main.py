@@ -2,14 +2,19 @@
 nak-base FastAPI メインアプリケーション
 Phase 1-1: DB診断機能付き
 """
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
+import copy
+import logging
+import os
+import time
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 
 from .routers import auth, papers, stream
-from .services.queue_service import get_queue_length
+from .services.queue_service import get_queue_status, close_async_redis_client
 from .database import engine, Base
 from .config import get_settings
 
@@ -23,6 +28,35 @@ def print_banner(title: str, status: str, symbol: str = "=") -> None:
     print(f"{symbol * width}\n")
 
 
+def configure_logging(debug: bool) -> None:
+    """
+    アプリケーション (app.*) のロガーを設定
+
+    DEBUG_MODE の時だけ DEBUG ログを出力する。
+    呼び出し側で debug_mode を都度確認しなくても、出力しないログは書式化もされない
+    """
+    app_logger = logging.getLogger("app")
+    if not app_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+        app_logger.addHandler(handler)
+    app_logger.setLevel(logging.DEBUG if debug else logging.INFO)
+    app_logger.propagate = False
+
+
+configure_logging(get_settings().debug_mode)
+
+
+# 複数ワーカー起動時にマイグレーションを1プロセスだけで実行するためのロックキー
+STARTUP_LOCK_KEY = "nakbase_startup"
+
+# 起動ロック待ちのポーリング間隔（秒）
+STARTUP_LOCK_POLL_INTERVAL = 0.5
+
+# /diagnostics の結果をキャッシュする秒数
+DIAGNOSTICS_CACHE_TTL = 60
+
+
 def run_db_diagnostics() -> dict:
     """
     Run database diagnostics at startup:
@@ -40,39 +74,37 @@ def run_db_diagnostics() -> dict:
 
     try:
         with engine.connect() as conn:
+            # 接続確認・pgvector確認・テーブル存在確認を1往復で実行する
+            # information_schema の全テーブル走査ではなく、対象テーブルのみ pg_class を引く
+            row = conn.execute(
+                text("""
+                    WITH t AS (
+                        SELECT name, ord, to_regclass('public.' || name) IS NOT NULL AS present
+                        FROM unnest(CAST(:names AS text[])) WITH ORDINALITY AS u(name, ord)
+                    )
+                    SELECT
+                        EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'vector') AS has_vector,
+                        COALESCE(array_agg(name ORDER BY ord) FILTER (WHERE present), '{}') AS found,
+                        COALESCE(array_agg(name ORDER BY ord) FILTER (WHERE NOT present), '{}') AS missing
+                    FROM t
+                """),
+                {"names": critical_tables}
+            ).one()
+
             # 1. Connection check
-            conn.execute(text("SELECT 1"))
             results["connection"]["status"] = "OK"
             results["connection"]["message"] = "Database connection successful"
 
             # 2. pgvector extension check
-            pgvector_result = conn.execute(
-                text("SELECT * FROM pg_extension WHERE extname = 'vector'")
-            ).fetchone()
-
-            if pgvector_result:
+            if row.has_vector:
                 results["pgvector"]["status"] = "OK"
                 results["pgvector"]["message"] = "pgvector extension is enabled"
             else:
                 results["pgvector"]["message"] = "pgvector extension NOT found"
 
             # 3. Tables existence check
-            tables_result = conn.execute(
-                text("""
-                    SELECT table_name
-                    FROM information_schema.tables
-                    WHERE table_schema = 'public'
-                    AND table_type = 'BASE TABLE'
-                """)
-            ).fetchall()
-
-            existing_tables = {row[0] for row in tables_result}
-
-            for table in critical_tables:
-                if table in existing_tables:
-                    results["tables"]["found"].append(table)
-                else:
-                    results["tables"]["missing"].append(table)
+            results["tables"]["found"] = list(row.found)
+            results["tables"]["missing"] = list(row.missing)
 
             if not results["tables"]["missing"]:
                 results["tables"]["status"] = "OK"
@@ -88,6 +120,29 @@ def run_db_diagnostics() -> dict:
     return results
 
 
+# (取得時刻, 診断結果) - 接続に成功した結果のみ保持する
+_diagnostics_cache: tuple[float, dict] | None = None
+
+
+def get_cached_db_diagnostics() -> dict:
+    """
+    Return diagnostics, re-running them at most once per DIAGNOSTICS_CACHE_TTL seconds.
+
+    接続に失敗した結果はキャッシュしない（DB復旧後すぐに正常な結果を返すため）
+    呼び出し側が結果を変更してもキャッシュに影響しないよう、コピーを返す
+    """
+    global _diagnostics_cache
+
+    cached = _diagnostics_cache
+    if cached is not None and time.monotonic() - cached[0] < DIAGNOSTICS_CACHE_TTL:
+        return copy.deepcopy(cached[1])
+
+    results = run_db_diagnostics()
+    if results["connection"]["status"] == "OK":
+        _diagnostics_cache = (time.monotonic(), copy.deepcopy(results))
+    return results
+
+
 def print_diagnostics_report(results: dict) -> None:
     """Print formatted diagnostics report to console"""
     print("\n" + "=" * 60)
@@ -146,7 +201,6 @@ def run_migrations() -> bool:
     try:
         from alembic.config import Config
         from alembic import command
-        import os
 
         # Get the path to alembic.ini
         backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -169,6 +223,55 @@ def run_migrations() -> bool:
         return False
 
 
+def prewarm_vector_index() -> bool:
+    """Load embeddings and its ANN index into shared_buffers (pg_prewarm)"""
+    try:
+        with engine.connect() as conn:
+            index_blocks = conn.execute(text("SELECT pg_prewarm('ix_embeddings_vector')")).scalar()
+            table_blocks = conn.execute(text("SELECT pg_prewarm('embeddings')")).scalar()
+            print(f"  -> Prewarmed {index_blocks} index blocks, {table_blocks} table blocks")
+            return True
+    except Exception as e:
+        print(f"  -> Failed to prewarm vector index: {e}")
+        return False
+
+
+@contextmanager
+def startup_lock():
+    """
+    PostgreSQLのアドバイザリロックで起動処理を直列化する
+
+    ロックを取得できたプロセスだけが True を受け取りマイグレーション等を実行する。
+    取得できなかったプロセスは勝者の処理完了を待ってから False を受け取る。
+    DBに接続できない場合は従来通り各プロセスで実行させる（True）。
+    """
+    try:
+        # AUTOCOMMIT: ロック待ちの間もトランザクション（スナップショット）を保持しない
+        # 保持していると勝者の CREATE INDEX CONCURRENTLY がこの接続の終了を待ち、デッドロックになる
+        conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+    except Exception:
+        yield True
+        return
+
+    try:
+        acquired = conn.execute(
+            text("SELECT pg_try_advisory_lock(hashtext(:key))"), {"key": STARTUP_LOCK_KEY}
+        ).scalar()
+        if not acquired:
+            # 勝者のマイグレーション完了を待つ
+            # ブロッキングの pg_advisory_lock は実行中の文がスナップショットを持つため、短い間隔でポーリングする
+            while not conn.execute(
+                text("SELECT pg_try_advisory_lock(hashtext(:key))"), {"key": STARTUP_LOCK_KEY}
+            ).scalar():
+                time.sleep(STARTUP_LOCK_POLL_INTERVAL)
+        try:
+            yield bool(acquired)
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(hashtext(:key))"), {"key": STARTUP_LOCK_KEY})
+    finally:
+        conn.close()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan - startup and shutdown events"""
@@ -176,22 +279,43 @@ async def lifespan(app: FastAPI):
 
     print_banner("NAK-BASE API STARTING", f"Debug Mode: {settings.debug_mode}")
 
-    # Step 1: Create pgvector extension
-    print("  [STARTUP] Step 1: Creating pgvector extension...")
-    create_pgvector_extension()
-
-    # Step 2: Run migrations
-    print("  [STARTUP] Step 2: Running database migrations...")
-    run_migrations()
+    if not settings.run_migrations:
+        # マイグレーション担当外のプロセスでは alembic 自体を読み込まない
+        print("  [STARTUP] Steps 1-2 skipped: RUN_MIGRATIONS is disabled")
+    else:
+        with startup_lock() as is_leader:
+            if is_leader:
+                # Step 1: Create pgvector extension
+                print("  [STARTUP] Step 1: Creating pgvector extension...")
+                create_pgvector_extension()
+
+                # Step 2: Run migrations
+                print("  [STARTUP] Step 2: Running database migrations...")
+                run_migrations()
+            else:
+                print("  [STARTUP] Steps 1-2 skipped: another worker ran extension setup and migrations")
 
     # Step 3: Run diagnostics
     print("  [STARTUP] Step 3: Running database diagnostics...")
     diagnostics = run_db_diagnostics()
     print_diagnostics_report(diagnostics)
 
+    # Step 4: Prewarm vector index (開発時はコストを払わない)
+    if not settings.debug_mode:
+        print("  [STARTUP] Step 4: Prewarming vector index...")
+        prewarm_vector_index()
+
+    # アップロード保存先を用意（リクエスト毎には確認しない）
+    os.makedirs(settings.storage_path, exist_ok=True)
+
+    # SSE配信用の Redis Pub/Sub 購読を開始（プロセス内で1接続を共有）
+    stream.start_broker()
+
     yield
 
     # Shutdown
+    await stream.stop_broker()
+    await close_async_redis_client()
     print_banner("NAK-BASE API SHUTTING DOWN", "Goodbye!")
 
 
@@ -199,16 +323,19 @@ app = FastAPI(
     title="nak-base API",
     description="論文フィードバックシステム - Phase 1.5 SSE対応",
     version="1.5.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # 全エンドポイントのJSONシリアライズを orjson で行う
+    default_response_class=ORJSONResponse,
 )
 
 # CORS settings
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://frontend:3000"],
+    allow_origin_regex=r"^https?://(localhost|frontend):3000$",
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,  # プリフライト結果をブラウザに1日キャッシュさせる
 )
 
 # Include routers
@@ -231,13 +358,14 @@ def root():
 @app.get("/health")
 def health_check():
     """Detailed health check."""
+    redis_ok, queue_length = get_queue_status()
     return {
-        "status": "healthy",
-        "queue_length": get_queue_length()
+        "status": "healthy" if redis_ok else "degraded",
+        "queue_length": queue_length
     }
 
 
 @app.get("/diagnostics")
 def get_diagnostics():
-    """Run and return database diagnostics."""
-    return run_db_diagnostics()
+    """Run and return database diagnostics (cached for DIAGNOSTICS_CACHE_TTL seconds)."""
+    return get_cached_db_diagnostics()
@@ -5,19 +5,20 @@ nak-base 完成形データモデル
 Enum値は全て大文字で統一（DB側と一致させる）
 """
 from sqlalchemy import (
-    Column, Integer, String, Text, DateTime, Boolean,
-    ForeignKey, Enum as SQLEnum, CheckConstraint, PrimaryKeyConstraint
+    Column, Integer, BigInteger, Identity, String, Text, DateTime, Boolean,
+    ForeignKey, FetchedValue, Enum as SQLEnum, CheckConstraint, PrimaryKeyConstraint, Index, text
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 import enum
 
 from .database import Base
 
 
 # ================== Enum Definitions (全大文字で統一) ==================
+# DB側は PostgreSQL の ENUM 型ではなく VARCHAR(20) + CHECK 制約で保持する（migration 012）
 
 class UserRole(str, enum.Enum):
     ADMIN = "ADMIN"
@@ -60,10 +61,10 @@ class User(Base):
     """
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
     name = Column(String(255), nullable=False)
-    role = Column(SQLEnum(UserRole), nullable=False, default=UserRole.STUDENT)
+    role = Column(SQLEnum(UserRole, native_enum=False, create_constraint=True, length=20, name="ck_users_role"), nullable=False, default=UserRole.STUDENT)
     last_login_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
 
@@ -80,10 +81,10 @@ class Paper(Base):
     """
     __tablename__ = "papers"
 
-    paper_id = Column(Integer, primary_key=True, index=True)
-    owner_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    paper_id = Column(BigInteger, Identity(always=True), primary_key=True)
+    owner_id = Column(BigInteger, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     title = Column(String(500), nullable=False)
-    status = Column(SQLEnum(PaperStatus), nullable=False, default=PaperStatus.PROCESSING)
+    status = Column(SQLEnum(PaperStatus, native_enum=False, create_constraint=True, length=20, name="ck_papers_status"), nullable=False, default=PaperStatus.PROCESSING)
     is_deleted = Column(Boolean, nullable=False, default=False)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -91,7 +92,17 @@ class Paper(Base):
     # Relationships
     owner = relationship("User", back_populates="owned_papers")
     authors = relationship("PaperAuthor", back_populates="paper", cascade="all, delete-orphan")
-    versions = relationship("Version", back_populates="paper", cascade="all, delete-orphan")
+    # 論文詳細 (PaperDetail) で必ず参照するため、親の取得時に IN (...) で一括ロード
+    versions = relationship("Version", back_populates="paper", cascade="all, delete-orphan", lazy="selectin")
+
+    __table_args__ = (
+        # 論文一覧（作成日時の降順）用。ORDER BY をインデックス順で返してソートを省く
+        Index(
+            "ix_papers_active_created",
+            created_at.desc(),
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
 
 class PaperAuthor(Base):
@@ -101,8 +112,8 @@ class PaperAuthor(Base):
     """
     __tablename__ = "paper_authors"
 
-    paper_id = Column(Integer, ForeignKey("papers.paper_id", ondelete="CASCADE"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    paper_id = Column(BigInteger, ForeignKey("papers.paper_id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     author_order = Column(Integer, nullable=False, default=1)
     is_corresponding_author = Column(Boolean, nullable=False, default=False)
 
@@ -112,6 +123,7 @@ class PaperAuthor(Base):
 
     __table_args__ = (
         PrimaryKeyConstraint("paper_id", "user_id"),
+        Index("ix_paper_authors_user_id", "user_id"),
     )
 
 
@@ -122,14 +134,14 @@ class Version(Base):
     """
     __tablename__ = "versions"
 
-    version_id = Column(Integer, primary_key=True, index=True)
-    paper_id = Column(Integer, ForeignKey("papers.paper_id", ondelete="CASCADE"), nullable=False)
+    version_id = Column(BigInteger, Identity(always=True), primary_key=True)
+    paper_id = Column(BigInteger, ForeignKey("papers.paper_id", ondelete="CASCADE"), nullable=False)
     version_number = Column(Integer, nullable=False, default=1)
     created_at = Column(DateTime, server_default=func.now())
 
     # Relationships
     paper = relationship("Paper", back_populates="versions")
-    files = relationship("File", back_populates="version", cascade="all, delete-orphan")
+    files = relationship("File", back_populates="version", cascade="all, delete-orphan", lazy="selectin")
     feedbacks = relationship("Feedback", back_populates="version", cascade="all, delete-orphan")
     inference_tasks = relationship("InferenceTask", back_populates="version", cascade="all, delete-orphan")
 
@@ -146,6 +158,11 @@ class Version(Base):
         back_populates="previous_version"
     )
 
+    __table_args__ = (
+        # 論文毎の最新バージョン取得用
+        Index("ix_versions_paper_version_number", "paper_id", version_number.desc()),
+    )
+
 
 class File(Base):
     """
@@ -154,9 +171,9 @@ class File(Base):
     """
     __tablename__ = "files"
 
-    file_id = Column(Integer, primary_key=True, index=True)
-    version_id = Column(Integer, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
-    file_role = Column(SQLEnum(FileRole), nullable=False, default=FileRole.MAIN_PDF)
+    file_id = Column(BigInteger, Identity(always=True), primary_key=True)
+    version_id = Column(BigInteger, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
+    file_role = Column(SQLEnum(FileRole, native_enum=False, create_constraint=True, length=20, name="ck_files_file_role"), nullable=False, default=FileRole.MAIN_PDF)
     is_primary = Column(Boolean, nullable=False, default=False)
     drive_file_id = Column(String(255), nullable=True)
     cache_path = Column(String(500), nullable=True)
@@ -169,6 +186,12 @@ class File(Base):
     version = relationship("Version", back_populates="files")
     embeddings = relationship("Embedding", back_populates="file", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_files_version_id", "version_id"),
+        # アップロード時の重複ファイル検出用
+        Index("ix_files_file_hash", "file_hash", postgresql_where=text("file_hash IS NOT NULL")),
+    )
+
 
 class Feedback(Base):
     """
@@ -177,9 +200,9 @@ class Feedback(Base):
     """
     __tablename__ = "feedbacks"
 
-    feedback_id = Column(Integer, primary_key=True, index=True)
-    version_id = Column(Integer, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
-    task_id = Column(Integer, ForeignKey("inference_tasks.task_id", ondelete="SET NULL"), nullable=True)
+    feedback_id = Column(BigInteger, Identity(always=True), primary_key=True)
+    version_id = Column(BigInteger, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
+    task_id = Column(BigInteger, ForeignKey("inference_tasks.task_id", ondelete="SET NULL"), nullable=True)
     score_json = Column(JSONB, nullable=True)
     comments_json = Column(JSONB, nullable=True)
     overall_summary = Column(Text, nullable=True)
@@ -189,6 +212,24 @@ class Feedback(Base):
     version = relationship("Version", back_populates="feedbacks")
     task = relationship("InferenceTask", back_populates="feedback")
 
+    __table_args__ = (
+        Index("ix_feedbacks_version_id", "version_id"),
+        Index("ix_feedbacks_task_id", "task_id"),
+        # @> 包含検索用（jsonb_path_ops は jsonb_ops より小さく高速）
+        Index(
+            "ix_feedbacks_score_json",
+            "score_json",
+            postgresql_using="gin",
+            postgresql_ops={"score_json": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_feedbacks_comments_json",
+            "comments_json",
+            postgresql_using="gin",
+            postgresql_ops={"comments_json": "jsonb_path_ops"},
+        ),
+    )
+
 
 class InferenceTask(Base):
     """
@@ -197,9 +238,9 @@ class InferenceTask(Base):
     """
     __tablename__ = "inference_tasks"
 
-    task_id = Column(Integer, primary_key=True, index=True)
-    version_id = Column(Integer, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
-    status = Column(SQLEnum(TaskStatus), nullable=False, default=TaskStatus.PENDING)
+    task_id = Column(BigInteger, Identity(always=True), primary_key=True)
+    version_id = Column(BigInteger, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
+    status = Column(SQLEnum(TaskStatus, native_enum=False, create_constraint=True, length=20, name="ck_inference_tasks_status"), nullable=False, default=TaskStatus.PENDING)
     error_message = Column(Text, nullable=True)
     retry_count = Column(Integer, nullable=False, default=0)
     conference_rule_id = Column(String(50), ForeignKey("conference_rules.rule_id", ondelete="SET NULL"), nullable=True)
@@ -212,6 +253,24 @@ class InferenceTask(Base):
     conference_rule = relationship("ConferenceRule", back_populates="inference_tasks")
     feedback = relationship("Feedback", back_populates="task", uselist=False)
 
+    __table_args__ = (
+        # バージョン毎の最新タスク取得用
+        Index("ix_inference_tasks_version_created", "version_id", created_at.desc()),
+        # 処理中タスクの取得用部分インデックス（FIFO順）
+        Index(
+            "ix_inference_tasks_status_active",
+            "status",
+            "created_at",
+            postgresql_where=text("status IN ('PENDING', 'PARSING', 'RAG', 'LLM')"),
+        ),
+        # 処理中タスクの version 単位の検索用部分インデックス
+        Index(
+            "ix_inference_tasks_version_active",
+            "version_id",
+            postgresql_where=text("status IN ('PENDING', 'PARSING', 'RAG', 'LLM')"),
+        ),
+    )
+
 
 class Embedding(Base):
     """
@@ -220,20 +279,41 @@ class Embedding(Base):
     """
     __tablename__ = "embeddings"
 
-    id = Column(Integer, primary_key=True, index=True)
-    file_id = Column(Integer, ForeignKey("files.file_id", ondelete="CASCADE"), nullable=False)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
+    file_id = Column(BigInteger, ForeignKey("files.file_id", ondelete="CASCADE"), nullable=False)
+    # file_id から DBトリガーで自動設定（論文単位のRAG絞り込み用の非正規化列）
+    paper_id = Column(BigInteger, ForeignKey("papers.paper_id", ondelete="CASCADE"), nullable=False, server_default=FetchedValue())
     chunk_index = Column(Integer, nullable=False)
     section_title = Column(String(255), nullable=True)
     page_number = Column(Integer, nullable=True)
     line_number = Column(Integer, nullable=True)
     content_chunk = Column(Text, nullable=False)
     location_json = Column(JSONB, nullable=True)  # {"page": 1, "bbox": [x0, y0, x1, y1]}
-    embedding = Column(Vector(1536), nullable=True)  # OpenAI/Gemma embedding dimension
+    embedding = Column(HALFVEC(1536), nullable=True)  # OpenAI/Gemma embedding dimension (FP16)
     created_at = Column(DateTime, server_default=func.now())
 
     # Relationships
     file = relationship("File", back_populates="embeddings")
 
+    __table_args__ = (
+        Index("ix_embeddings_file_chunk", "file_id", "chunk_index"),
+        Index(
+            "ix_embeddings_file_page",
+            "file_id",
+            "page_number",
+            postgresql_where=text("page_number IS NOT NULL"),
+        ),
+        Index("ix_embeddings_paper_id", "paper_id"),
+        # ANN検索用 HNSW インデックス（migrations 002/003 で CONCURRENTLY 構築済み）
+        Index(
+            "ix_embeddings_vector",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+    )
+
 
 class ConferenceRule(Base):
     """
@@ -251,6 +331,15 @@ class ConferenceRule(Base):
     # Relationships
     inference_tasks = relationship("InferenceTask", back_populates="conference_rule")
 
+    __table_args__ = (
+        Index(
+            "ix_conference_rules_format_rules",
+            "format_rules",
+            postgresql_using="gin",
+            postgresql_ops={"format_rules": "jsonb_path_ops"},
+        ),
+    )
+
 
 class VersionDiff(Base):
     """
@@ -258,9 +347,9 @@ class VersionDiff(Base):
     """
     __tablename__ = "version_diffs"
 
-    diff_id = Column(Integer, primary_key=True, index=True)
-    current_version_id = Column(Integer, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
-    previous_version_id = Column(Integer, ForeignKey("versions.version_id", ondelete="SET NULL"), nullable=True)
+    diff_id = Column(BigInteger, Identity(always=True), primary_key=True)
+    current_version_id = Column(BigInteger, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
+    previous_version_id = Column(BigInteger, ForeignKey("versions.version_id", ondelete="SET NULL"), nullable=True)
     text_diff_json = Column(JSONB, nullable=True)
     semantic_diff_text = Column(Text, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
@@ -276,3 +365,8 @@ class VersionDiff(Base):
         foreign_keys=[previous_version_id],
         back_populates="previous_diffs"
     )
+
+    __table_args__ = (
+        Index("ix_version_diffs_current_version_id", "current_version_id"),
+        Index("ix_version_diffs_previous_version_id", "previous_version_id"),
+    )
@@ -3,23 +3,27 @@ MVP版 認証ルーター
 デモユーザー（id=1）のみ対応
 """
 from fastapi import APIRouter, Depends
-from datetime import datetime, timedelta
-from jose import jwt
+from datetime import datetime, timedelta, timezone
+import jwt
 from ..config import get_settings
 from ..schemas import TokenResponse
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 settings = get_settings()
 
+# トークン生成毎に設定を参照しないよう、起動時に1度だけ取り出しておく
+_SECRET_KEY = settings.secret_key.encode("utf-8")  # HMAC鍵としてbytesで保持
+_ALGORITHM = settings.algorithm
+_TOKEN_EXPIRE = timedelta(minutes=settings.access_token_expire_minutes)
+
 
 def create_access_token(user_id: int) -> str:
     """JWTアクセストークンを生成"""
-    expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
     payload = {
         "sub": str(user_id),
-        "exp": expire
+        "exp": datetime.now(timezone.utc) + _TOKEN_EXPIRE,
     }
-    return jwt.encode(payload, settings.secret_key, algorithm=settings.algorithm)
+    return jwt.encode(payload, _SECRET_KEY, algorithm=_ALGORITHM)
 
 
 @router.post("/demo-login", response_model=TokenResponse)
@@ -2,37 +2,237 @@
 論文ルーター
 Phase 1.5: SSE対応・参照モード対応
 """
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from typing import List, Optional
+from sqlalchemy import bindparam, insert, or_, select, true
+from pydantic import TypeAdapter
+from types import MappingProxyType
+from typing import BinaryIO, List, Optional
+from datetime import datetime
+import hashlib
+import logging
 import os
+import time
 import uuid
 
 from ..database import get_db
 from ..models import Paper, Version, File as FileModel, InferenceTask, Feedback, PaperStatus, TaskStatus, FileRole
 from ..schemas import (
     PaperResponse, PaperDetail, PaperListItem,
-    VersionResponse, InferenceTaskResponse, UploadResponse, FeedbackResponse
+    VersionResponse, InferenceTaskResponse, UploadResponse, FeedbackResponse,
+    construct_from_orm, paper_detail_from_orm,
+)
+from ..services.queue_service import (
+    enqueue_and_notify_async, publish_paper_list_changed, get_paper_list_version
 )
-from ..services.queue_service import push_task_with_payload
 from ..config import get_settings
 
 router = APIRouter(prefix="/papers", tags=["papers"])
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# 設定はプロセス内で不変（frozen）のため、リクエスト処理で使う値はモジュール定数として保持
+_STORAGE_PATH = settings.storage_path
+
+# アップロードファイルの読み込み単位（1 MiB）
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# よく使う参照クエリは一度だけ構築し、値は bindparam で渡す
+# （リクエスト毎の文構築を省き、コンパイル済みSQLのキャッシュを確実に再利用させる）
+_VERSIONS_BY_PAPER = (
+    select(Version)
+    .where(Version.paper_id == bindparam("paper_id"))
+    .order_by(Version.version_number.desc())
+)
+_FEEDBACK_BY_VERSION = (
+    select(Feedback)
+    .where(Feedback.version_id == bindparam("version_id"))
+    .limit(1)
+)
+
+# バージョン一覧のシリアライザ（検証は行わず JSON 化にのみ使う）
+_VERSION_LIST_ADAPTER = TypeAdapter(List[VersionResponse])
+
+# 論文一覧キャッシュの有効期限（秒）
+# 無効化は Redis の世代番号で行うため、これは世代番号を経由しない変更に対する保険
+PAPER_LIST_CACHE_TTL = 30.0
+
+# (世代番号, 取得時刻, シリアライズ済みの一覧JSON) - 論文・タスクの変更で世代番号が進むと使われなくなる
+_paper_list_cache: tuple[int, float, bytes] | None = None
+
+# 論文一覧のシリアライザ（キャッシュ作成時に1度だけ JSON 化する）
+_PAPER_LIST_ADAPTER = TypeAdapter(List[PaperListItem])
+
+
+# タスクステータス -> フロントエンド表示用のフェーズ文字列（読み取り専用）
+_PHASE_MAP = MappingProxyType({
+    TaskStatus.PENDING: "待機中",
+    TaskStatus.PARSING: "PDF解析中 (1/3)",
+    TaskStatus.RAG: "RAG処理中 (2/3)",
+    TaskStatus.LLM: "AI分析中 (3/3)",
+    TaskStatus.COMPLETED: "完了",
+    TaskStatus.ERROR: "エラー",
+})
+
+
+# 受け付ける拡張子 -> FileRole
+_EXT_TO_ROLE = MappingProxyType({
+    ".pdf": FileRole.MAIN_PDF,
+    ".docx": FileRole.MAIN_DOCX,
+    ".zip": FileRole.SOURCE_TEX,
+    ".tex": FileRole.SOURCE_TEX,
+})
+
+
+def _json_response(content: str | bytes) -> Response:
+    """
+    シリアライズ済みのJSONをそのまま返す
+
+    DBから読み込んだ値を model_construct したスキーマを返す場合に使う。
+    Response を直接返すと FastAPI は response_model による再検証を行わない
+    （response_model はOpenAPIのスキーマ定義としてのみ使われる）
+    """
+    return Response(content=content, media_type="application/json")
 
 
 def get_task_phase_text(status: TaskStatus) -> str:
     """タスクステータスからフロントエンド表示用のフェーズ文字列を生成"""
-    phase_map = {
-        TaskStatus.PENDING: "待機中",
-        TaskStatus.PARSING: "PDF解析中 (1/3)",
-        TaskStatus.RAG: "RAG処理中 (2/3)",
-        TaskStatus.LLM: "AI分析中 (3/3)",
-        TaskStatus.COMPLETED: "完了",
-        TaskStatus.ERROR: "エラー",
-    }
-    return phase_map.get(status, "不明")
+    return _PHASE_MAP.get(status, "不明")
+
+
+def resolve_file_role(filename: str) -> tuple[str, FileRole]:
+    """
+    ファイル名の拡張子から保存用拡張子と FileRole を決定
+
+    Raises:
+        HTTPException: 対応していない拡張子の場合 (400)
+    """
+    file_ext = os.path.splitext(filename)[1].lower()
+    file_role = _EXT_TO_ROLE.get(file_ext)
+    if file_role is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Only PDF, ZIP, TeX, and DOCX files are accepted. Got: {filename}"
+        )
+    return file_ext, file_role
+
+
+def save_upload_file(src: BinaryIO, file_path: str) -> str:
+    """
+    アップロードファイルを保存し、SHA-256 を返す
+
+    全体をメモリに載せず、固定長のバッファを使い回して
+    読み込み・書き込み・ハッシュ計算を同じループで行う
+    書き込みは一度きりのため、バッファ付きファイルを介さず fd に直接書く
+
+    Returns:
+        str: ファイル内容の SHA-256 (hex)
+    """
+    hasher = hashlib.sha256()
+    buffer = bytearray(UPLOAD_CHUNK_SIZE)
+    view = memoryview(buffer)
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while n := src.readinto(buffer):
+            chunk = view[:n]
+            hasher.update(chunk)
+            while chunk:
+                chunk = chunk[os.write(fd, chunk):]
+    finally:
+        os.close(fd)
+    return hasher.hexdigest()
+
+
+def insert_files(db: Session, rows: List[dict]) -> List[int]:
+    """
+    File レコードを1回の INSERT ... RETURNING でまとめて登録
+
+    Args:
+        rows: File の列名をキーとする dict のリスト
+
+    Returns:
+        List[int]: 採番された file_id（rows と同じ順）
+    """
+    return list(db.execute(
+        insert(FileModel).values(rows).returning(FileModel.file_id)
+    ).scalars())
+
+
+def find_duplicate_upload(db: Session, file_hash: str, is_reference: bool = False):
+    """
+    同一ハッシュのファイルを持つ（削除されていない）論文のうち、再利用できるものを検索
+
+    最新タスクが ERROR の論文は対象外とする（解析に失敗した論文を返し続けると、
+    同じファイルを再アップロードしても再解析できないため）
+    通常のアップロードでは、参考論文として登録され解析されていない論文
+    （タスクが開始されないまま COMPLETED になっているもの）も対象外とする
+
+    Returns:
+        (paper_id, title, version_id, task_id) の行、見つからなければ None
+    """
+    latest_task = (
+        select(InferenceTask.task_id, InferenceTask.status, InferenceTask.started_at)
+        .where(InferenceTask.version_id == FileModel.version_id)
+        .order_by(InferenceTask.created_at.desc(), InferenceTask.task_id.desc())
+        .limit(1)
+        .lateral()
+    )
+    conditions = [
+        FileModel.file_hash == file_hash,
+        Paper.is_deleted == False,
+        latest_task.c.status != TaskStatus.ERROR,
+    ]
+    if not is_reference:
+        conditions.append(or_(
+            latest_task.c.status != TaskStatus.COMPLETED,
+            latest_task.c.started_at.is_not(None),
+        ))
+    return db.execute(
+        select(Version.paper_id, Paper.title, FileModel.version_id, latest_task.c.task_id)
+        .join(Version, Version.version_id == FileModel.version_id)
+        .join(Paper, Paper.paper_id == Version.paper_id)
+        .join(latest_task, true())
+        .where(*conditions)
+        .order_by(FileModel.file_id.desc())
+        .limit(1)
+    ).first()
+
+
+def mark_enqueue_failed(db: Session, created: List[tuple[Paper, Version, InferenceTask]]) -> None:
+    """
+    キューに投入できなかったタスクと論文を ERROR にする
+
+    worker に拾われないまま PENDING / PROCESSING で残さず、
+    同じファイルの再アップロードで再解析できるようにする（ERROR の論文は重複扱いしない）
+    """
+    now = datetime.utcnow()
+    for paper, _, task in created:
+        task.status = TaskStatus.ERROR
+        task.error_message = "Failed to enqueue task"
+        task.completed_at = now
+        paper.status = PaperStatus.ERROR
+    db.commit()
+
+
+async def enqueue_created(
+    db: Session,
+    created: List[tuple[Paper, Version, InferenceTask]],
+    is_reference: bool,
+) -> None:
+    """
+    作成したタスクのキュー投入（参考論文でない場合のみ）と一覧の変更通知を1往復で行う
+
+    Raises:
+        HTTPException: タスクをキューに投入できなかった場合 (503)
+    """
+    task_ids = [] if is_reference else [task.task_id for _, _, task in created]
+    paper_ids = [paper.paper_id for paper, _, _ in created]
+    if await enqueue_and_notify_async(paper_ids, task_ids, "ANALYSIS") or not task_ids:
+        return
+
+    await run_in_threadpool(mark_enqueue_failed, db, created)
+    raise HTTPException(status_code=503, detail="Task queue is unavailable. Please retry the upload.")
 
 
 @router.get("/", response_model=List[PaperListItem])
@@ -41,56 +241,92 @@ def list_papers(db: Session = Depends(get_db)):
     論文一覧を取得（削除されていないもののみ）
 
     最新バージョンのタスク情報を含むフラットなレスポンスを返す
+    世代番号が変わっていなければキャッシュした一覧JSONをそのまま返す
+    （キャッシュヒット時はスキーマの検証・シリアライズを一切行わない）
     """
-    papers = db.query(Paper).filter(Paper.is_deleted == False).order_by(Paper.created_at.desc()).all()
-
-    result = []
-    for paper in papers:
-        # 最新バージョンを取得
-        latest_version = db.query(Version).filter(
-            Version.paper_id == paper.paper_id
-        ).order_by(desc(Version.version_number)).first()
-
-        latest_task = None
-        if latest_version:
-            # 最新バージョンの最新タスクを取得
-            latest_task = db.query(InferenceTask).filter(
-                InferenceTask.version_id == latest_version.version_id
-            ).order_by(desc(InferenceTask.created_at)).first()
-
-        item = PaperListItem(
-            paper_id=paper.paper_id,
-            owner_id=paper.owner_id,
-            title=paper.title,
-            status=paper.status,
-            created_at=paper.created_at,
-            latest_task_id=latest_task.task_id if latest_task else None,
-            latest_task_status=latest_task.status if latest_task else None,
-            phase=get_task_phase_text(latest_task.status) if latest_task else None,
+    global _paper_list_cache
+
+    # クエリより先に世代番号を読む（クエリ中に変更があれば次回は別の世代になる）
+    list_version = get_paper_list_version()
+    cached = _paper_list_cache
+    if (
+        cached is not None
+        and list_version is not None
+        and cached[0] == list_version
+        and time.monotonic() - cached[1] < PAPER_LIST_CACHE_TTL
+    ):
+        return _json_response(cached[2])
+
+    # 論文毎の最新バージョン・バージョン毎の最新タスクを DISTINCT ON で求め、
+    # 論文一覧と結合して1クエリで取得する（全バージョン・全タスクは読み込まない）
+    latest_versions = (
+        select(Version.paper_id, Version.version_id)
+        .distinct(Version.paper_id)
+        .order_by(Version.paper_id, Version.version_number.desc())
+        .subquery()
+    )
+    latest_tasks = (
+        select(InferenceTask.version_id, InferenceTask.task_id, InferenceTask.status)
+        .distinct(InferenceTask.version_id)
+        .order_by(InferenceTask.version_id, InferenceTask.created_at.desc(), InferenceTask.task_id.desc())
+        .subquery()
+    )
+    rows = db.execute(
+        select(
+            Paper.paper_id,
+            Paper.owner_id,
+            Paper.title,
+            Paper.status,
+            Paper.created_at,
+            latest_tasks.c.task_id,
+            latest_tasks.c.status.label("task_status"),
         )
-        result.append(item)
+        .outerjoin(latest_versions, latest_versions.c.paper_id == Paper.paper_id)
+        .outerjoin(latest_tasks, latest_tasks.c.version_id == latest_versions.c.version_id)
+        .where(Paper.is_deleted == False)
+        .order_by(Paper.created_at.desc())
+    ).all()
+
+    result = [
+        PaperListItem(
+            paper_id=row.paper_id,
+            owner_id=row.owner_id,
+            title=row.title,
+            status=row.status,
+            created_at=row.created_at,
+            latest_task_id=row.task_id,
+            latest_task_status=row.task_status,
+            phase=get_task_phase_text(row.task_status) if row.task_status is not None else None,
+        )
+        for row in rows
+    ]
 
-    return result
+    body = _PAPER_LIST_ADAPTER.dump_json(result)
+    if list_version is not None:
+        _paper_list_cache = (list_version, time.monotonic(), body)
+    return _json_response(body)
 
 
 @router.get("/{paper_id}", response_model=PaperDetail)
 def get_paper(paper_id: int, db: Session = Depends(get_db)):
     """論文詳細を取得（バージョンとファイル含む）"""
-    paper = db.query(Paper).filter(Paper.paper_id == paper_id, Paper.is_deleted == False).first()
-    if not paper:
+    paper = db.get(Paper, paper_id)
+    if not paper or paper.is_deleted:
         raise HTTPException(status_code=404, detail="Paper not found")
-    return paper
+    return _json_response(paper_detail_from_orm(paper).model_dump_json())
 
 
 @router.get("/{paper_id}/versions", response_model=List[VersionResponse])
 def list_versions(paper_id: int, db: Session = Depends(get_db)):
     """論文のバージョン一覧を取得"""
-    paper = db.query(Paper).filter(Paper.paper_id == paper_id).first()
+    paper = db.get(Paper, paper_id)
     if not paper:
         raise HTTPException(status_code=404, detail="Paper not found")
 
-    versions = db.query(Version).filter(Version.paper_id == paper_id).order_by(Version.version_number.desc()).all()
-    return versions
+    versions = db.scalars(_VERSIONS_BY_PAPER, {"paper_id": paper_id}).all()
+    return _json_response(_VERSION_LIST_ADAPTER.dump_json(
+        [construct_from_orm(VersionResponse, v) for v in versions]
+    ))
 
 
 @router.post("/upload", response_model=UploadResponse)
@@ -112,148 +348,269 @@ async def upload_paper(
     1. ファイルをローカルボリュームに保存
     2. Paper レコード作成
     3. Version レコード作成 (version_number=1)
-    4. File レコード作成
-    5. InferenceTask レコード作成 (status=Pending)
+    4. InferenceTask レコード作成 (status=Pending)
+    5. File レコード作成
     6. Redisにタスクを投入（job_typeを含む）
     """
-    if settings.debug_mode:
-        print(f"【デバッグ】論文アップロード受信: タイトル='{title}', ファイル='{file.filename}', is_reference={is_reference}")
-
-    # PDF, ZIP, TeX, DOCXを受付
-    lower_filename = file.filename.lower()
-    allowed_extensions = ('.pdf', '.zip', '.tex', '.docx')
-    if not any(lower_filename.endswith(ext) for ext in allowed_extensions):
-        raise HTTPException(
-            status_code=400,
-            detail=f"Only PDF, ZIP, TeX, and DOCX files are accepted. Got: {file.filename}"
-        )
+    logger.debug("論文アップロード受信: タイトル='%s', ファイル='%s', is_reference=%s", title, file.filename, is_reference)
 
-    # ファイル拡張子を取得してFileRoleを決定
-    if lower_filename.endswith('.pdf'):
-        file_ext = '.pdf'
-        file_role = FileRole.MAIN_PDF
-    elif lower_filename.endswith('.docx'):
-        file_ext = '.docx'
-        file_role = FileRole.MAIN_DOCX
-    elif lower_filename.endswith('.zip'):
-        file_ext = '.zip'
-        file_role = FileRole.SOURCE_TEX
-    else:  # .tex
-        file_ext = '.tex'
-        file_role = FileRole.SOURCE_TEX
+    # PDF, ZIP, TeX, DOCXを受付（拡張子からFileRoleを決定）
+    file_ext, file_role = resolve_file_role(file.filename)
 
     # ファイル保存（UUIDで一意なファイル名）
     file_uuid = str(uuid.uuid4())
     file_name = f"{file_uuid}{file_ext}"
-    file_path = os.path.join(settings.storage_path, file_name)
-
-    # ストレージディレクトリ確認
-    os.makedirs(settings.storage_path, exist_ok=True)
-
-    # ファイル保存
-    content = await file.read()
-    with open(file_path, "wb") as f:
-        f.write(content)
+    file_path = os.path.join(_STORAGE_PATH, file_name)
+    tmp_path = os.path.join(_STORAGE_PATH, f".tmp-{file_uuid}")
+
+    # ファイル保存（ディスク書き込み中にイベントループを止めないようスレッドプールで実行）
+    # 一時ファイルに書き込みながらハッシュを計算し、重複でなければ本来のパスへ rename する
+    # 書き込み・重複検索・rename のいずれに失敗した場合も一時ファイルを残さない
+    try:
+        file_hash = await run_in_threadpool(save_upload_file, file.file, tmp_path)
+
+        # 同一内容のファイルが登録済みなら、一時ファイルを破棄して既存の論文を返す
+        # （再解析・キュー投入を行わない）
+        # 同期ドライバのDBアクセスはイベントループを止めないようスレッドプールで実行する
+        duplicate = await run_in_threadpool(find_duplicate_upload, db, file_hash, is_reference)
+        if duplicate:
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, file_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    if duplicate:
+        logger.debug("重複ファイルのため既存の論文を返します: paper_id=%s", duplicate.paper_id)
+        # 既存の論文のタイトルは変更しないため、異なるタイトルが指定された場合はその旨を返す
+        message = "Duplicate file, returning existing paper"
+        if duplicate.title != title:
+            message += f" (title not changed: {duplicate.title})"
+        return UploadResponse(
+            message=message,
+            paper_id=duplicate.paper_id,
+            version_id=duplicate.version_id,
+            task_id=duplicate.task_id
+        )
 
-    if settings.debug_mode:
-        print(f"【デバッグ】ローカルストレージに保存完了: {file_path}")
+    logger.debug("ローカルストレージに保存完了: %s", file_path)
+
+    # 1〜4 のレコード作成は1トランザクションで行う
+    # リレーションで親子を結び、1回の flush で外部キーを解決・主キーを採番して
+    # 最後に1回だけ commit する（expire_on_commit=False のため refresh 不要）
+    def create_records():
+        try:
+            # 1. Paper作成
+            # 参考論文の場合は最初からCOMPLETEDステータス
+            initial_status = PaperStatus.COMPLETED if is_reference else PaperStatus.PROCESSING
+
+            paper = Paper(
+                owner_id=1,  # デモユーザー（Phase 2でOAuth実装時に変更）
+                title=title,
+                status=initial_status
+            )
+
+            # 2. Version作成
+            version = Version(
+                paper=paper,
+                version_number=1
+            )
+
+            # 3. InferenceTask作成
+            # 参考論文の場合はCOMPLETEDステータスで作成（解析スキップ）
+            initial_task_status = TaskStatus.COMPLETED if is_reference else TaskStatus.PENDING
+
+            task = InferenceTask(
+                version=version,
+                status=initial_task_status
+            )
+            db.add_all([paper, version, task])
+            db.flush()
+
+            logger.debug("Paper作成: paper_id=%s", paper.paper_id)
+            logger.debug("Version作成: version_id=%s", version.version_id)
+
+            # 4. File作成（複数ファイルのアップロードでも1文で登録できるよう行リストで渡す）
+            file_ids = insert_files(db, [{
+                "version_id": version.version_id,
+                "file_role": file_role,
+                "is_primary": True,
+                "cache_path": file_path,
+                "is_cached": True,
+                "file_hash": file_hash,
+                "original_filename": file.filename,
+            }])
+            db.commit()
+        except Exception:
+            db.rollback()
+            # DBに登録できなかったファイルは残さない
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            raise
+        return paper, version, task, file_ids
+
+    paper, version, task, file_ids = await run_in_threadpool(create_records)
+
+    logger.debug("File作成: file_ids=%s", file_ids)
+    logger.debug("InferenceTask作成: task_id=%s, status=%s", task.task_id, task.status)
+
+    # 5. Redisにタスク追加（参考論文でない場合のみ）と一覧の変更通知を1往復で行う
+    await enqueue_created(db, [(paper, version, task)], is_reference)
 
-    # 1. Paper作成
-    # 参考論文の場合は最初からCOMPLETEDステータス
-    initial_status = PaperStatus.COMPLETED if is_reference else PaperStatus.PROCESSING
-
-    paper = Paper(
-        owner_id=1,  # デモユーザー（Phase 2でOAuth実装時に変更）
-        title=title,
-        status=initial_status
-    )
-    db.add(paper)
-    db.commit()
-    db.refresh(paper)
-
-    if settings.debug_mode:
-        print(f"【デバッグ】Paper作成: paper_id={paper.paper_id}")
+    if not is_reference:
+        logger.debug("RedisキューにTask ID=%sを投入しました", task.task_id)
+    else:
+        logger.debug("参考論文のためキューへの投入をスキップしました")
 
-    # 2. Version作成
-    version = Version(
+    return UploadResponse(
+        message="Upload successful" if not is_reference else "Reference paper registered",
         paper_id=paper.paper_id,
-        version_number=1
+        version_id=version.version_id,
+        task_id=task.task_id
     )
-    db.add(version)
-    db.commit()
-    db.refresh(version)
 
-    if settings.debug_mode:
-        print(f"【デバッグ】Version作成: version_id={version.version_id}")
 
-    # 3. File作成
-    file_record = FileModel(
-        version_id=version.version_id,
-        file_role=file_role,
-        is_primary=True,
-        cache_path=file_path,
-        is_cached=True,
-        original_filename=file.filename
-    )
-    db.add(file_record)
-    db.commit()
-    db.refresh(file_record)
+@router.post("/bulk_upload", response_model=List[UploadResponse])
+async def bulk_upload_papers(
+    files: List[UploadFile] = File(...),
+    is_reference: Optional[bool] = Form(False),
+    db: Session = Depends(get_db)
+):
+    """
+    複数の論文を一括アップロード（タイトルはファイル名から生成）
 
-    if settings.debug_mode:
-        print(f"【デバッグ】File作成: file_id={file_record.file_id}")
+    全ファイルのレコードを1トランザクション・1回の flush で作成し、
+    Redisへのタスク投入と一覧の変更通知も1往復にまとめる。
+    登録済みと同一内容のファイルは既存の論文を返す。
+    """
+    # 保存前に全ファイルの拡張子を検証する
+    roles = [resolve_file_role(f.filename) for f in files]
+
+    responses: List[Optional[UploadResponse]] = []
+    pending = []  # (応答の位置, UploadFile, FileRole, 保存先, ハッシュ)
+    # 同じバッチ内の同一内容のファイル（未登録のためDB検索では見つからない）
+    first_in_batch: dict[str, int] = {}  # ハッシュ -> 最初のファイルの応答の位置
+    same_in_batch = []  # (応答の位置, 同一内容の最初のファイルの応答の位置)
+    tmp_path = None
+    try:
+        for upload, (file_ext, file_role) in zip(files, roles):
+            file_uuid = uuid.uuid4()
+            file_path = os.path.join(_STORAGE_PATH, f"{file_uuid}{file_ext}")
+            tmp_path = os.path.join(_STORAGE_PATH, f".tmp-{file_uuid}")
+            file_hash = await run_in_threadpool(save_upload_file, upload.file, tmp_path)
+
+            if file_hash in first_in_batch:
+                os.remove(tmp_path)
+                same_in_batch.append((len(responses), first_in_batch[file_hash]))
+                responses.append(None)
+                continue
+
+            duplicate = await run_in_threadpool(find_duplicate_upload, db, file_hash, is_reference)
+            if duplicate:
+                os.remove(tmp_path)
+                responses.append(UploadResponse(
+                    message="Duplicate file, returning existing paper",
+                    paper_id=duplicate.paper_id,
+                    version_id=duplicate.version_id,
+                    task_id=duplicate.task_id
+                ))
+                continue
+
+            os.replace(tmp_path, file_path)
+            first_in_batch[file_hash] = len(responses)
+            pending.append((len(responses), upload, file_role, file_path, file_hash))
+            responses.append(None)
+    except Exception:
+        # 途中で失敗した場合は、保存済みのファイルと書き込み中の一時ファイルを残さない
+        for path in [tmp_path] + [file_path for _, _, _, file_path, _ in pending]:
+            if path and os.path.exists(path):
+                os.remove(path)
+        raise
 
-    # 4. InferenceTask作成
-    # 参考論文の場合はCOMPLETEDステータスで作成（解析スキップ）
+    initial_status = PaperStatus.COMPLETED if is_reference else PaperStatus.PROCESSING
     initial_task_status = TaskStatus.COMPLETED if is_reference else TaskStatus.PENDING
 
-    task = InferenceTask(
-        version_id=version.version_id,
-        status=initial_task_status
-    )
-    db.add(task)
-    db.commit()
-    db.refresh(task)
-
-    if settings.debug_mode:
-        print(f"【デバッグ】InferenceTask作成: task_id={task.task_id}, status={initial_task_status}")
+    def create_records():
+        try:
+            created = []
+            for _, upload, _, _, _ in pending:
+                paper = Paper(
+                    owner_id=1,  # デモユーザー（Phase 2でOAuth実装時に変更）
+                    title=os.path.splitext(upload.filename)[0],
+                    status=initial_status
+                )
+                version = Version(paper=paper, version_number=1)
+                task = InferenceTask(version=version, status=initial_task_status)
+                created.append((paper, version, task))
+                db.add_all([paper, version, task])
+            db.flush()
+
+            insert_files(db, [
+                {
+                    "version_id": version.version_id,
+                    "file_role": file_role,
+                    "is_primary": True,
+                    "cache_path": file_path,
+                    "is_cached": True,
+                    "file_hash": file_hash,
+                    "original_filename": upload.filename,
+                }
+                for (_, upload, file_role, file_path, file_hash), (_, version, _) in zip(pending, created)
+            ])
+            db.commit()
+        except Exception:
+            db.rollback()
+            # DBに登録できなかったファイルは残さない
+            for _, _, _, file_path, _ in pending:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+            raise
+        return created
+
+    created = await run_in_threadpool(create_records)
+
+    message = "Reference paper registered" if is_reference else "Upload successful"
+    for (index, _, _, _, _), (paper, version, task) in zip(pending, created):
+        responses[index] = UploadResponse(
+            message=message,
+            paper_id=paper.paper_id,
+            version_id=version.version_id,
+            task_id=task.task_id
+        )
+    for index, first_index in same_in_batch:
+        responses[index] = responses[first_index].model_copy(
+            update={"message": "Duplicate file, returning existing paper"}
+        )
 
-    # 5. Redisにタスク追加（参考論文でない場合のみ）
-    if not is_reference:
-        job_type = "ANALYSIS"
-        push_task_with_payload(task.task_id, job_type)
+    if created:
+        await enqueue_created(db, created, is_reference)
 
-        if settings.debug_mode:
-            print(f"【デバッグ】RedisキューにTask ID={task.task_id}, job_type={job_type}を投入しました")
-    else:
-        if settings.debug_mode:
-            print(f"【デバッグ】参考論文のためキューへの投入をスキップしました")
+    logger.debug("一括アップロード: %s件 (新規 %s件)", len(files), len(created))
 
-    return UploadResponse(
-        message="Upload successful" if not is_reference else "Reference paper registered",
-        paper_id=paper.paper_id,
-        version_id=version.version_id,
-        task_id=task.task_id
-    )
+    return responses
 
 
 @router.get("/tasks/{task_id}", response_model=InferenceTaskResponse)
 def get_task(task_id: int, db: Session = Depends(get_db)):
     """タスク詳細を取得"""
-    task = db.query(InferenceTask).filter(InferenceTask.task_id == task_id).first()
+    task = db.get(InferenceTask, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    return task
+    return _json_response(construct_from_orm(InferenceTaskResponse, task).model_dump_json())
 
 
 @router.delete("/{paper_id}")
 def delete_paper(paper_id: int, db: Session = Depends(get_db)):
     """論文を論理削除"""
-    paper = db.query(Paper).filter(Paper.paper_id == paper_id).first()
+    paper = db.get(Paper, paper_id)
     if not paper:
         raise HTTPException(status_code=404, detail="Paper not found")
 
     paper.is_deleted = True
     db.commit()
+    publish_paper_list_changed(paper_id, "delete")
 
     return {"message": "Paper deleted successfully", "paper_id": paper_id}
 
@@ -261,7 +618,7 @@ def delete_paper(paper_id: int, db: Session = Depends(get_db)):
 @router.get("/versions/{version_id}/feedback", response_model=FeedbackResponse)
 def get_feedback(version_id: int, db: Session = Depends(get_db)):
     """特定バージョンのフィードバックを取得"""
-    feedback = db.query(Feedback).filter(Feedback.version_id == version_id).first()
+    feedback = db.scalars(_FEEDBACK_BY_VERSION, {"version_id": version_id}).first()
     if not feedback:
         raise HTTPException(status_code=404, detail="Feedback not found")
-    return feedback
+    return _json_response(construct_from_orm(FeedbackResponse, feedback).model_dump_json())
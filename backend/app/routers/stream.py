@@ -1,9 +1,13 @@
 """
 SSEストリーミングルーター
 Phase 1.5: sse-starletteによるリアルタイム通知 (Async Redis版)
+
+Redis Pub/Sub の購読はプロセス内で1つだけ行い（ブローカー）、
+受信したメッセージを接続中の各SSEクライアントのキューへ配信する。
+クライアント数に関わらず Redis 側の接続・配信は1本で済む。
 """
 import asyncio
-import json
+import logging
 from fastapi import APIRouter, Request
 from sse_starlette.sse import EventSourceResponse
 from redis import asyncio as aioredis  # 非同期ライブラリを使用
@@ -11,22 +15,84 @@ from ..config import get_settings
 
 router = APIRouter(prefix="/api/stream", tags=["stream"])
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 # Redis Pub/Sub チャンネル名
 NOTIFICATION_CHANNEL = "task_notifications"
+PAPER_LIST_CHANNEL = "paper_list_changed"
+
+# 購読するチャンネル一覧
+BROKER_CHANNELS = (NOTIFICATION_CHANNEL, PAPER_LIST_CHANNEL)
+
+# クライアント毎のキュー上限（溢れた場合は古いメッセージから捨てる）
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# Redis 切断時の再接続待ち（秒）
+BROKER_RECONNECT_DELAY = 1.0
+
+# チャンネル -> 接続中クライアントのキュー
+_subscribers: dict[str, set[asyncio.Queue]] = {channel: set() for channel in BROKER_CHANNELS}
+_broker_task: asyncio.Task | None = None
+
 
-async def get_async_redis_client():
-    """SSE専用の非同期Redisクライアント"""
-    return await aioredis.from_url(settings.redis_url, decode_responses=True)
+def _deliver(queue: asyncio.Queue, data: str) -> None:
+    """キューにメッセージを積む（満杯なら最も古いものを捨てる）"""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(data)
 
-async def event_generator(request: Request):
+
+async def _broker_loop() -> None:
+    """
+    Redis Pub/Sub を1接続で購読し、各クライアントのキューへ配信する
+    Redis が切断された場合は再接続して購読を続ける
+    """
+    while True:
+        client = aioredis.from_url(settings.redis_url, decode_responses=True)
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(*BROKER_CHANNELS)
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                for queue in tuple(_subscribers.get(message["channel"], ())):
+                    _deliver(queue, message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("SSE broker error: %s", e)
+            await asyncio.sleep(BROKER_RECONNECT_DELAY)
+        finally:
+            await pubsub.aclose()
+            await client.aclose()
+
+
+def start_broker() -> None:
+    """ブローカーを起動（アプリ起動時に1度だけ呼ぶ）"""
+    global _broker_task
+    if _broker_task is None or _broker_task.done():
+        _broker_task = asyncio.create_task(_broker_loop())
+
+
+async def stop_broker() -> None:
+    """ブローカーを停止（アプリ終了時）"""
+    global _broker_task
+    if _broker_task is not None:
+        _broker_task.cancel()
+        try:
+            await _broker_task
+        except asyncio.CancelledError:
+            pass
+        _broker_task = None
+
+
+async def event_generator(request: Request, channel: str = NOTIFICATION_CHANNEL):
     """
     SSEイベントジェネレーター
-    非同期Redisを使用してサーバーをブロックせずに待機
+    ブローカーから配信されたメッセージをクライアントに送出する
     """
-    client = await get_async_redis_client()
-    pubsub = client.pubsub()
-    await pubsub.subscribe(NOTIFICATION_CHANNEL)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    _subscribers[channel].add(queue)
 
     try:
         while True:
@@ -34,36 +100,24 @@ async def event_generator(request: Request):
             if await request.is_disconnected():
                 break
 
-            # 非同期でメッセージを取得（ここでサーバー全体の処理を止めない）
-            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.5)
-            
-            if message and message["type"] == "message":
-                data = message["data"]
-                # decode_responses=Trueにしているのでbytes変換不要な場合が多いが念のため
-                if isinstance(data, bytes):
-                    data = data.decode("utf-8")
-                
-                # sse-starletteはdictを渡すと自動でフォーマットしてくれる
-                yield {
-                    "event": "message",
-                    "data": data
-                }
-            else:
-                # Keep-alive ping（データがない時だけ送る必要はないが、接続維持のため）
-                # sse-starletteのping引数に任せる手もあるが、手動yieldの方が確実な場合も
-                pass
-
-            # ループのCPU占有を防ぐための微小待機
-            await asyncio.sleep(0.1)
+            # 受信すると即座に返るため、切断チェックの間隔としてのみ timeout を使う
+            try:
+                data = await asyncio.wait_for(queue.get(), timeout=1.0)
+            except asyncio.TimeoutError:
+                continue
+
+            # sse-starletteはdictを渡すと自動でフォーマットしてくれる
+            yield {
+                "event": "message",
+                "data": data
+            }
 
     except asyncio.CancelledError:
-        print("SSE Client disconnected")
+        logger.debug("SSE Client disconnected")
     except Exception as e:
-        print(f"SSE Error: {e}")
+        logger.warning("SSE Error: %s", e)
     finally:
-        await pubsub.unsubscribe(NOTIFICATION_CHANNEL)
-        await pubsub.close()
-        await client.aclose() # クライアントも閉じる
+        _subscribers[channel].discard(queue)
 
 @router.get("/notifications")
 async def stream_notifications(request: Request):
@@ -74,4 +128,22 @@ async def stream_notifications(request: Request):
         event_generator(request),
         ping=15, # 自動Ping機能
         media_type="text/event-stream"
-    )
\ No newline at end of file
+    )
+
+
+@router.get("/papers")
+async def stream_paper_list(request: Request):
+    """
+    論文一覧の変更通知ストリーム（アップロード・削除時）
+
+    イベントデータ形式:
+    {
+        "paper_id": 1,
+        "action": "upsert" | "delete"
+    }
+    """
+    return EventSourceResponse(
+        event_generator(request, PAPER_LIST_CHANNEL),
+        ping=15,
+        media_type="text/event-stream"
+    )
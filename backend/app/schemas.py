@@ -4,11 +4,13 @@ Phase 1-1: 新モデル構造対応
 
 Enum値は全て大文字で統一（DB側と一致させる）
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
 
+from .models import Paper
+
 
 # ================== Enum Definitions (全大文字で統一) ==================
 
@@ -50,6 +52,8 @@ class UserBase(BaseModel):
     email: str
     name: str
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class UserCreate(UserBase):
     role: UserRoleEnum = UserRoleEnum.STUDENT
@@ -63,8 +67,7 @@ class UserResponse(BaseModel):
     last_login_at: Optional[datetime] = None
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # ================== Paper Schemas ==================
@@ -72,6 +75,8 @@ class UserResponse(BaseModel):
 class PaperCreate(BaseModel):
     title: str
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PaperResponse(BaseModel):
     paper_id: int
@@ -81,8 +86,7 @@ class PaperResponse(BaseModel):
     is_deleted: bool
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ================== Version Schemas ==================
@@ -93,8 +97,7 @@ class VersionResponse(BaseModel):
     version_number: int
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ================== File Schemas ==================
@@ -109,8 +112,7 @@ class FileResponse(BaseModel):
     original_filename: Optional[str] = None
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ================== InferenceTask Schemas ==================
@@ -125,8 +127,7 @@ class InferenceTaskResponse(BaseModel):
     completed_at: Optional[datetime] = None
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ================== Feedback Schemas ==================
@@ -140,8 +141,7 @@ class FeedbackResponse(BaseModel):
     overall_summary: Optional[str] = None
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ================== Composite Schemas ==================
@@ -153,11 +153,39 @@ class VersionWithFiles(VersionResponse):
 class PaperWithVersions(PaperResponse):
     versions: List[VersionResponse] = []
 
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
 
 class PaperDetail(PaperResponse):
     versions: List[VersionWithFiles] = []
 
 
+# ================== ORM -> Response (検証なし) ==================
+# DBから読み込んだ値は既に型が確定しているため、model_construct で検証を省いて組み立てる
+# （from_attributes による全フィールドの型検査・変換を行わない）
+
+def construct_from_orm(model: type[BaseModel], obj, **overrides) -> BaseModel:
+    """ORMオブジェクトから、スキーマの各フィールドを同名属性で埋めたモデルを検証なしで生成"""
+    values = {name: getattr(obj, name) for name in model.model_fields if name not in overrides}
+    return model.model_construct(**values, **overrides)
+
+
+def paper_detail_from_orm(paper: Paper) -> PaperDetail:
+    """Paper (versions / files ロード済み) から PaperDetail を検証なしで生成"""
+    return construct_from_orm(
+        PaperDetail,
+        paper,
+        versions=[
+            construct_from_orm(
+                VersionWithFiles,
+                version,
+                files=[construct_from_orm(FileResponse, f) for f in version.files],
+            )
+            for version in paper.versions
+        ],
+    )
+
+
 # ================== Upload Response ==================
 
 class UploadResponse(BaseModel):
@@ -184,8 +212,8 @@ class PaperListItem(BaseModel):
     latest_task_status: Optional[TaskStatusEnum] = None
     phase: Optional[str] = None  # フロントエンド表示用のフェーズ文字列
 
-    class Config:
-        from_attributes = True
+    # 生成後に変更することはないため frozen にする
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ================== Auth Schemas ==================
@@ -197,6 +225,7 @@ class TokenResponse(BaseModel):
 
 # ================== Legacy Compatibility (MVP) ==================
 # These schemas maintain backward compatibility during transition
+# どのエンドポイントからも使われていないため、初回利用まで検証器を構築しない (defer_build)
 
 class LegacyTaskResponse(BaseModel):
     """MVP互換: 旧Taskスキーマ（InferenceTaskへのマッピング用）"""
@@ -209,8 +238,7 @@ class LegacyTaskResponse(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class LegacyPaperResponse(BaseModel):
@@ -220,8 +248,7 @@ class LegacyPaperResponse(BaseModel):
     title: str
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class LegacyPaperWithTasks(LegacyPaperResponse):
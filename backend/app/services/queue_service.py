@@ -2,19 +2,72 @@
 Phase 1.5 キューサービス
 job_type対応版
 """
-import json
+import logging
+import orjson
 import redis
+from redis import asyncio as aioredis
 from ..config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 TASK_QUEUE = "tasks"
 NOTIFICATION_CHANNEL = "task_notifications"
+PAPER_LIST_CHANNEL = "paper_list_changed"
 
+# 論文一覧の世代番号（論文・タスクの変更毎に INCR し、一覧キャッシュの無効化に使う）
+PAPER_LIST_VERSION_KEY = "papers:list:sig"
 
-def get_redis_client():
-    """Get Redis client."""
-    return redis.from_url(settings.redis_url)
+# RPUSH 1コマンドあたりの要素数上限
+QUEUE_PUSH_BATCH_SIZE = 10_000
+
+
+_redis_client: redis.Redis | None = None
+
+
+def get_redis_client() -> redis.Redis:
+    """
+    Get shared Redis client.
+
+    URL解析・コネクションプール生成を呼び出し毎に行わないよう、
+    プロセス内で1つのクライアント（= 1つのコネクションプール）を使い回す
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(
+            settings.redis_url,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+    return _redis_client
+
+
+_async_redis_client: aioredis.Redis | None = None
+
+
+def get_async_redis_client() -> aioredis.Redis:
+    """
+    async ハンドラ用の共有 Redis クライアントを取得
+
+    async def のエンドポイントから同期クライアントを呼ぶとイベントループが止まるため、
+    そちらでは redis.asyncio のクライアントを使う（イベントループ上で作成・使用すること）
+    """
+    global _async_redis_client
+    if _async_redis_client is None:
+        _async_redis_client = aioredis.from_url(
+            settings.redis_url,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+    return _async_redis_client
+
+
+async def close_async_redis_client() -> None:
+    """async 用クライアントを閉じる（アプリ終了時）"""
+    global _async_redis_client
+    if _async_redis_client is not None:
+        await _async_redis_client.aclose()
+        _async_redis_client = None
 
 
 def push_task(task_id: int) -> bool:
@@ -26,31 +79,55 @@ def push_task(task_id: int) -> bool:
         client.rpush(TASK_QUEUE, str(task_id))
         return True
     except Exception as e:
-        print(f"Error pushing task to queue: {e}")
+        logger.error("Error pushing task to queue: %s", e)
         return False
 
 
-def push_task_with_payload(task_id: int, job_type: str = "ANALYSIS") -> bool:
+def _queue_tasks(pipe, task_ids: list[int], job_type: str) -> None:
+    """タスクの RPUSH をパイプラインに積む（QUEUE_PUSH_BATCH_SIZE 件ずつ可変長引数で1コマンド）"""
+    for start in range(0, len(task_ids), QUEUE_PUSH_BATCH_SIZE):
+        pipe.rpush(TASK_QUEUE, *(
+            orjson.dumps({"task_id": task_id, "job_type": job_type})
+            for task_id in task_ids[start:start + QUEUE_PUSH_BATCH_SIZE]
+        ))
+
+
+def _queue_paper_list_changed(pipe, paper_ids: list[int], action: str) -> None:
+    """論文一覧の世代番号の更新と変更通知をパイプラインに積む"""
+    if paper_ids:
+        pipe.incr(PAPER_LIST_VERSION_KEY)
+        for paper_id in paper_ids:
+            pipe.publish(PAPER_LIST_CHANNEL, orjson.dumps({"paper_id": paper_id, "action": action}))
+
+
+async def enqueue_and_notify_async(
+    paper_ids: list[int],
+    task_ids: list[int],
+    job_type: str = "ANALYSIS"
+) -> bool:
     """
-    タスクIDとジョブタイプをキューに追加
+    タスクのキュー投入と論文一覧の変更通知を1往復で行う（イベントループをブロックしない）
+
+    タスクのペイロードは worker の parse_task_data が読む形式
+    {"task_id": int, "job_type": str} で投入する
 
     Args:
-        task_id: タスクID
+        paper_ids: 作成・更新された論文IDのリスト（"upsert" として通知）
+        task_ids: キューに投入するタスクIDのリスト（空なら投入しない）
         job_type: "ANALYSIS" (通常解析) または "REFERENCE_ONLY" (参考論文)
 
     Returns:
         bool: 成功/失敗
     """
-    client = get_redis_client()
+    client = get_async_redis_client()
     try:
-        payload = json.dumps({
-            "task_id": task_id,
-            "job_type": job_type
-        })
-        client.rpush(TASK_QUEUE, payload)
+        pipe = client.pipeline(transaction=False)
+        _queue_tasks(pipe, task_ids, job_type)
+        _queue_paper_list_changed(pipe, paper_ids, "upsert")
+        await pipe.execute()
         return True
     except Exception as e:
-        print(f"Error pushing task to queue: {e}")
+        logger.error("Error enqueueing tasks / publishing paper list change: %s", e)
         return False
 
 
@@ -80,13 +157,51 @@ def publish_notification(
             "phase": phase,
             "error_message": error_message,
         }
-        client.publish(NOTIFICATION_CHANNEL, json.dumps(notification))
+        client.publish(NOTIFICATION_CHANNEL, orjson.dumps(notification))
+        return True
+    except Exception as e:
+        logger.error("Error publishing notification: %s", e)
+        return False
+
+
+def publish_paper_list_changed(paper_id: int, action: str) -> bool:
+    """
+    論文一覧の変更通知をRedis Pub/Subに発行
+    フロントエンドは通知を受けた時だけ一覧を再取得する
+
+    Args:
+        paper_id: 変更された論文ID
+        action: "upsert" (作成・更新) または "delete" (削除)
+
+    Returns:
+        bool: 発行成功/失敗
+    """
+    client = get_redis_client()
+    try:
+        pipe = client.pipeline(transaction=False)
+        _queue_paper_list_changed(pipe, [paper_id], action)
+        pipe.execute()
         return True
     except Exception as e:
-        print(f"Error publishing notification: {e}")
+        logger.error("Error publishing paper list change: %s", e)
         return False
 
 
+def get_paper_list_version() -> int | None:
+    """
+    論文一覧の世代番号を取得
+
+    Returns:
+        int | None: 世代番号（Redisに接続できない場合は None）
+    """
+    client = get_redis_client()
+    try:
+        return int(client.get(PAPER_LIST_VERSION_KEY) or 0)
+    except Exception as e:
+        logger.error("Error reading paper list version: %s", e)
+        return None
+
+
 def pop_task() -> int | None:
     """
     タスクIDをキューから取得（ブロッキング）
@@ -99,7 +214,7 @@ def pop_task() -> int | None:
             return int(data)
         return None
     except Exception as e:
-        print(f"Error popping task from queue: {e}")
+        logger.error("Error popping task from queue: %s", e)
         return None
 
 
@@ -107,3 +222,21 @@ def get_queue_length() -> int:
     """Get current queue length."""
     client = get_redis_client()
     return client.llen(TASK_QUEUE)
+
+
+def get_queue_status() -> tuple[bool, int]:
+    """
+    Redisの疎通確認とキュー長取得をパイプラインで1往復にまとめて実行
+
+    Returns:
+        tuple: (PINGの成否, キュー長)。Redisに接続できない場合は (False, 0)
+    """
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        pipe.ping()
+        pipe.llen(TASK_QUEUE)
+        pong, queue_length = pipe.execute()
+        return bool(pong), queue_length
+    except redis.RedisError as e:
+        logger.error("Error checking queue status: %s", e)
+        return False, 0
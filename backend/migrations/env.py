@@ -21,7 +21,7 @@ from app.config import get_settings
 from app import models  # noqa: F401 - ensure all models are loaded
 
 # pgvector support
-from pgvector.sqlalchemy import Vector  # noqa: F401
+from pgvector.sqlalchemy import Vector, HALFVEC  # noqa: F401
 
 # this is the Alembic Config object
 config = context.config
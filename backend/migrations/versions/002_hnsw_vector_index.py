@@ -0,0 +1,42 @@
+"""Switch embeddings ANN index from IVFFlat to HNSW
+
+Revision ID: 002_hnsw_index
+Revises: 001_initial
+Create Date: 2026-10-16
+
+IVFFlat は lists 数をデータ件数に合わせて再構築する必要があり、
+lists = 100 固定では逐次追加されるRAGコーパスに対して最適にならない。
+HNSW は学習不要で、少〜中規模のコーパスでも高いリコールと低レイテンシを維持できる。
+
+パラメータは pgvector 推奨値 (m = 16, ef_construction = 64)。
+
+インデックス構築は時間がかかるため autocommit_block 内で CONCURRENTLY 実行し、
+構築中もカタログロックを保持し続けないようにする。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002_hnsw_index'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_embeddings_vector")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embeddings_vector ON embeddings "
+            "USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_embeddings_vector")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embeddings_vector ON embeddings "
+            "USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)"
+        )
@@ -0,0 +1,54 @@
+"""Store embeddings as halfvec (FP16)
+
+Revision ID: 003_halfvec
+Revises: 002_hnsw_index
+Create Date: 2026-10-16
+
+embeddings.embedding を vector(1536) (FP32, 6144 bytes/row) から
+halfvec(1536) (FP16, 3072 bytes/row) に変換する。
+
+ANN検索はページ読み込みのメモリ帯域がボトルネックになるため、
+1行あたりのサイズを半分にすることでヒープ・HNSWインデックスとも
+1ページに載る行数が約2倍になり、I/O量がほぼ半減する。
+文埋め込みに対するFP16化のリコール低下は無視できる程度。
+
+halfvec は pgvector >= 0.7 が必要。
+
+列の型変換はトランザクション内で行い、時間のかかるHNSWの再構築のみ
+autocommit_block 内で CONCURRENTLY 実行する。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003_halfvec'
+down_revision: Union[str, None] = '002_hnsw_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_embeddings_vector")
+    op.execute(
+        "ALTER TABLE embeddings ALTER COLUMN embedding TYPE halfvec(1536) "
+        "USING embedding::halfvec(1536)"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embeddings_vector ON embeddings "
+            "USING hnsw (embedding halfvec_cosine_ops) WITH (m = 16, ef_construction = 64)"
+        )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_embeddings_vector")
+    op.execute(
+        "ALTER TABLE embeddings ALTER COLUMN embedding TYPE vector(1536) "
+        "USING embedding::vector(1536)"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embeddings_vector ON embeddings "
+            "USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)"
+        )
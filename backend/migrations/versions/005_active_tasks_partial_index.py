@@ -0,0 +1,32 @@
+"""Add partial index for active inference tasks
+
+Revision ID: 005_active_tasks
+Revises: 004_feedback_gin
+Create Date: 2026-10-16
+
+Worker/フロントエンドが参照するのは処理中のタスク
+(PENDING, PARSING, RAG, LLM) のみで、運用が進むと全体のごく一部になる。
+全行を対象とするインデックスではなく部分インデックスにすることで
+サイズとバッファ使用量を抑える。created_at を含めることで
+FIFO順の取得にソートが不要になる。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005_active_tasks'
+down_revision: Union[str, None] = '004_feedback_gin'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_inference_tasks_status_active ON inference_tasks (status, created_at) "
+        "WHERE status IN ('PENDING', 'PARSING', 'RAG', 'LLM')"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_inference_tasks_status_active")
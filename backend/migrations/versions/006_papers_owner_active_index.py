@@ -0,0 +1,31 @@
+"""Add covering index for per-owner paper listings
+
+Revision ID: 006_papers_owner_active
+Revises: 005_active_tasks
+Create Date: 2026-10-16
+
+ダッシュボードの「自分の論文一覧」
+(WHERE owner_id = ? AND is_deleted = false ORDER BY updated_at DESC)
+をソートなし・index-only scan で処理するための複合部分インデックス。
+一覧表示に必要な title, status を INCLUDE してヒープアクセスを省く。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '006_papers_owner_active'
+down_revision: Union[str, None] = '005_active_tasks'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_papers_owner_active ON papers (owner_id, updated_at DESC) "
+        "INCLUDE (title, status) WHERE is_deleted = false"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_papers_owner_active")
@@ -0,0 +1,45 @@
+"""Widen embeddings / files primary keys to BIGINT
+
+Revision ID: 007_bigint_ids
+Revises: 006_papers_owner_active
+Create Date: 2026-10-16
+
+embeddings はチャンク単位で行が増えるため、
+文書数 × チャンク数が int32 の上限 (約21億) を超え得る。
+将来の緊急マイグレーションを避けるため、
+embeddings.id / embeddings.file_id / files.file_id を BIGINT にする。
+SERIAL で作成されたシーケンスも AS bigint に広げる。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '007_bigint_ids'
+down_revision: Union[str, None] = '006_papers_owner_active'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE files ALTER COLUMN file_id TYPE BIGINT")
+    op.execute("ALTER SEQUENCE files_file_id_seq AS BIGINT")
+
+    op.execute(
+        "ALTER TABLE embeddings "
+        "ALTER COLUMN id TYPE BIGINT, "
+        "ALTER COLUMN file_id TYPE BIGINT"
+    )
+    op.execute("ALTER SEQUENCE embeddings_id_seq AS BIGINT")
+
+
+def downgrade() -> None:
+    op.execute("ALTER SEQUENCE embeddings_id_seq AS INTEGER")
+    op.execute(
+        "ALTER TABLE embeddings "
+        "ALTER COLUMN id TYPE INTEGER, "
+        "ALTER COLUMN file_id TYPE INTEGER"
+    )
+
+    op.execute("ALTER SEQUENCE files_file_id_seq AS INTEGER")
+    op.execute("ALTER TABLE files ALTER COLUMN file_id TYPE INTEGER")
@@ -0,0 +1,43 @@
+"""Improve physical locality of embeddings per file
+
+Revision ID: 008_embeddings_locality
+Revises: 007_bigint_ids
+Create Date: 2026-10-16
+
+ANN検索の top-k 取得後に「ファイルXの全チャンク」を読むため、
+(file_id, chunk_index) の複合インデックスを追加する。
+
+- fillfactor = 90 でページに空きを残し、更新をHOT更新として同一ページ内に収める
+- 環境変数 CLUSTER_EMBEDDINGS=1 の場合のみ、上記インデックス順に CLUSTER する
+  (CLUSTER は ACCESS EXCLUSIVE ロックを取るため既定では実行しない)
+
+運用メモ: 更新・削除を繰り返すと1ファイルのチャンクが複数ページに散らばるため、
+定期的な CLUSTER embeddings もしくは pg_repack の実行を運用手順に含めること。
+"""
+import os
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '008_embeddings_locality'
+down_revision: Union[str, None] = '007_bigint_ids'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_embeddings_file_chunk ON embeddings (file_id, chunk_index)"
+    )
+    op.execute("ALTER TABLE embeddings SET (fillfactor = 90)")
+
+    if os.getenv("CLUSTER_EMBEDDINGS") == "1":
+        with op.get_context().autocommit_block():
+            op.execute("CLUSTER embeddings USING ix_embeddings_file_chunk")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE embeddings SET WITHOUT CLUSTER")
+    op.execute("ALTER TABLE embeddings RESET (fillfactor)")
+    op.execute("DROP INDEX IF EXISTS ix_embeddings_file_chunk")
@@ -0,0 +1,28 @@
+"""Enable pg_prewarm extension
+
+Revision ID: 009_pg_prewarm
+Revises: 008_embeddings_locality
+Create Date: 2026-10-16
+
+再起動・デプロイ直後の最初のRAG検索で、HNSWインデックスのページを
+ランダムに読み込むコールドキャッシュのペナルティを避けるため、
+起動時に pg_prewarm で embeddings とそのベクトルインデックスを
+shared_buffers に読み込めるようにする（backend の lifespan から実行）。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '009_pg_prewarm'
+down_revision: Union[str, None] = '008_embeddings_locality'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_prewarm")
+
+
+def downgrade() -> None:
+    op.execute("DROP EXTENSION IF EXISTS pg_prewarm")
@@ -0,0 +1,38 @@
+"""Add page / location indexes on embeddings for citation lookups
+
+Revision ID: 010_embeddings_location
+Revises: 009_pg_prewarm
+Create Date: 2026-10-16
+
+RAGの引用箇所検索では「ファイルX の Nページ目〜Mページ目」のような
+ページ範囲での絞り込みを行う。ページ番号は型付きの page_number 列として
+既に保持しているため、JSONBからの式インデックスではなく
+(file_id, page_number) の B-tree で範囲スキャンさせる。
+
+location_json (bbox等) への包含検索 (@>) 用に jsonb_path_ops の GIN も追加する。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '010_embeddings_location'
+down_revision: Union[str, None] = '009_pg_prewarm'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_embeddings_file_page ON embeddings (file_id, page_number) "
+        "WHERE page_number IS NOT NULL"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_embeddings_location_json ON embeddings "
+        "USING gin (location_json jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_embeddings_location_json")
+    op.execute("DROP INDEX IF EXISTS ix_embeddings_file_page")
@@ -0,0 +1,67 @@
+"""Denormalize paper_id into embeddings
+
+Revision ID: 011_embeddings_paper_id
+Revises: 010_embeddings_location
+Create Date: 2026-10-16
+
+RAG検索を論文単位に絞り込むたびに embeddings → files → versions → papers の
+3段JOINが必要だったため、embeddings に paper_id を持たせて単一テーブルで
+絞り込めるようにする。
+
+paper_id は BEFORE INSERT / UPDATE OF file_id トリガーで file_id から自動設定するため、
+アプリケーション側の INSERT で指定する必要はない。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '011_embeddings_paper_id'
+down_revision: Union[str, None] = '010_embeddings_location'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE embeddings ADD COLUMN IF NOT EXISTS paper_id INTEGER "
+        "REFERENCES papers(paper_id) ON DELETE CASCADE"
+    )
+
+    # 既存行のバックフィル
+    op.execute("""
+        UPDATE embeddings e
+        SET paper_id = v.paper_id
+        FROM files f
+        JOIN versions v ON v.version_id = f.version_id
+        WHERE f.file_id = e.file_id
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_embedding_paper_id()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            SELECT v.paper_id INTO NEW.paper_id
+            FROM files f
+            JOIN versions v ON v.version_id = f.version_id
+            WHERE f.file_id = NEW.file_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER set_embeddings_paper_id
+            BEFORE INSERT OR UPDATE OF file_id ON embeddings
+            FOR EACH ROW
+            EXECUTE FUNCTION set_embedding_paper_id()
+    """)
+
+    op.execute("ALTER TABLE embeddings ALTER COLUMN paper_id SET NOT NULL")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_embeddings_paper_id ON embeddings (paper_id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_embeddings_paper_id")
+    op.execute("DROP TRIGGER IF EXISTS set_embeddings_paper_id ON embeddings")
+    op.execute("DROP FUNCTION IF EXISTS set_embedding_paper_id()")
+    op.execute("ALTER TABLE embeddings DROP COLUMN IF EXISTS paper_id")
@@ -0,0 +1,89 @@
+"""Replace PostgreSQL ENUM columns with VARCHAR + CHECK
+
+Revision ID: 012_enum_to_varchar
+Revises: 011_embeddings_paper_id
+Create Date: 2026-10-16
+
+userrole / filerole / taskstatus / paperstatus の ENUM 型を VARCHAR(20) + CHECK 制約に置き換える。
+
+- 値の追加が ALTER TYPE ではなく CHECK 制約の張り替えだけで済む
+- 文字列との比較で enum へのキャストが不要になり、(status, ...) の
+  複合・部分インデックスをそのまま使える
+- filerole に存在しなかった MAIN_DOCX (モデル側で追加済み) を許可する
+
+ENUM リテラルを述語に含む部分インデックス ix_inference_tasks_status_active は
+型変更前に削除し、変更後に再作成する。
+あわせて version 単位で処理中タスクを引くための部分インデックスを追加する。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '012_enum_to_varchar'
+down_revision: Union[str, None] = '011_embeddings_paper_id'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (テーブル, 列, ENUM型名, 既定値, 許可する値)
+ENUM_COLUMNS = [
+    ('users', 'role', 'userrole', 'STUDENT', ['ADMIN', 'PROFESSOR', 'STUDENT']),
+    ('papers', 'status', 'paperstatus', 'PROCESSING',
+     ['UPLOADED', 'PROCESSING', 'PARSED', 'EMBEDDED', 'FAILED', 'COMPLETED', 'ERROR']),
+    ('files', 'file_role', 'filerole', 'MAIN_PDF', ['MAIN_PDF', 'MAIN_DOCX', 'SOURCE_TEX', 'ADDITIONAL_FILE']),
+    ('inference_tasks', 'status', 'taskstatus', 'PENDING',
+     ['PENDING', 'PARSING', 'RAG', 'LLM', 'COMPLETED', 'ERROR']),
+]
+
+ACTIVE_TASK_STATUSES = "('PENDING', 'PARSING', 'RAG', 'LLM')"
+
+
+def _quoted(values: list[str]) -> str:
+    return ", ".join(f"'{v}'" for v in values)
+
+
+def _create_active_task_indexes() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_inference_tasks_status_active ON inference_tasks (status, created_at) "
+        f"WHERE status IN {ACTIVE_TASK_STATUSES}"
+    )
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_inference_tasks_status_active")
+
+    for table, column, type_name, default, values in ENUM_COLUMNS:
+        op.execute(f"""
+            ALTER TABLE {table}
+                ALTER COLUMN {column} DROP DEFAULT,
+                ALTER COLUMN {column} TYPE VARCHAR(20) USING {column}::text,
+                ALTER COLUMN {column} SET DEFAULT '{default}'
+        """)
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT ck_{table}_{column} "
+            f"CHECK ({column} IN ({_quoted(values)}))"
+        )
+        op.execute(f"DROP TYPE IF EXISTS {type_name}")
+
+    _create_active_task_indexes()
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_inference_tasks_version_active ON inference_tasks (version_id) "
+        f"WHERE status IN {ACTIVE_TASK_STATUSES}"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_inference_tasks_version_active")
+    op.execute("DROP INDEX IF EXISTS ix_inference_tasks_status_active")
+
+    for table, column, type_name, default, values in ENUM_COLUMNS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS ck_{table}_{column}")
+        op.execute(f"CREATE TYPE {type_name} AS ENUM ({_quoted(values)})")
+        op.execute(f"""
+            ALTER TABLE {table}
+                ALTER COLUMN {column} DROP DEFAULT,
+                ALTER COLUMN {column} TYPE {type_name} USING {column}::{type_name},
+                ALTER COLUMN {column} SET DEFAULT '{default}'
+        """)
+
+    _create_active_task_indexes()
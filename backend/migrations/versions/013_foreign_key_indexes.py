@@ -0,0 +1,46 @@
+"""Add B-tree indexes on foreign key columns
+
+Revision ID: 013_fk_indexes
+Revises: 012_enum_to_varchar
+Create Date: 2026-10-16
+
+PostgreSQL は外部キーの参照元列に自動でインデックスを作成しないため、
+papers → versions → files / feedbacks / inference_tasks の JOIN や
+ON DELETE CASCADE / SET NULL の処理が参照元テーブルのシーケンシャルスキャンになる。
+参照元列それぞれに B-tree インデックスを追加する。
+
+既存データがある環境でも書き込みを止めないよう、autocommit_block 内で CONCURRENTLY 作成する。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '013_fk_indexes'
+down_revision: Union[str, None] = '012_enum_to_varchar'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (インデックス名, テーブル, 列)
+FK_INDEXES = [
+    ('ix_paper_authors_user_id', 'paper_authors', 'user_id'),
+    ('ix_versions_paper_id', 'versions', 'paper_id'),
+    ('ix_files_version_id', 'files', 'version_id'),
+    ('ix_feedbacks_version_id', 'feedbacks', 'version_id'),
+    ('ix_feedbacks_task_id', 'feedbacks', 'task_id'),
+    ('ix_inference_tasks_version_id', 'inference_tasks', 'version_id'),
+    ('ix_version_diffs_current_version_id', 'version_diffs', 'current_version_id'),
+    ('ix_version_diffs_previous_version_id', 'version_diffs', 'previous_version_id'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in FK_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({column})")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(FK_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
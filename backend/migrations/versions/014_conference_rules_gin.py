@@ -0,0 +1,33 @@
+"""Add GIN index on conference_rules.format_rules
+
+Revision ID: 014_conference_rules_gin
+Revises: 013_fk_indexes
+Create Date: 2026-10-16
+
+format_rules への @> 包含検索（例: {"max_pages": 8} を含む学会ルール）用に
+jsonb_path_ops の GIN インデックスを追加する。
+包含検索しか行わないため、キー存在演算子 (?) 等にも対応する既定の jsonb_ops ではなく
+より小さく高速な jsonb_path_ops を使う（feedbacks は 004 で対応済み）。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '014_conference_rules_gin'
+down_revision: Union[str, None] = '013_fk_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_conference_rules_format_rules ON conference_rules "
+            "USING gin (format_rules jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_conference_rules_format_rules")
@@ -0,0 +1,78 @@
+"""Switch primary keys to BIGINT GENERATED ALWAYS AS IDENTITY
+
+Revision ID: 015_bigint_identity
+Revises: 014_conference_rules_gin
+Create Date: 2026-10-16
+
+SERIAL (int4 + 個別シーケンス + DEFAULT nextval) の主キーを
+BIGINT の IDENTITY 列に置き換え、参照する外部キー列も BIGINT にそろえる。
+
+- int4 の上限 (約21億) を気にする必要がなくなる
+- GENERATED ALWAYS により、アプリ側からの誤った ID 直接指定を防ぐ
+- 主キーと外部キーの型がそろい、JOIN 時の暗黙キャストがなくなる
+
+files.file_id / embeddings.id / embeddings.file_id は 007 で BIGINT 化済みのため
+型変更は行わず、IDENTITY 化のみ行う。
+列の型変更はテーブルの書き換えを伴うため、1テーブルにつき1回の ALTER TABLE にまとめる。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '015_bigint_identity'
+down_revision: Union[str, None] = '014_conference_rules_gin'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# テーブル -> (主キー列, BIGINT に変更する列)
+TABLES = {
+    'users': ('id', ['id']),
+    'papers': ('paper_id', ['paper_id', 'owner_id']),
+    'paper_authors': (None, ['paper_id', 'user_id']),
+    'versions': ('version_id', ['version_id', 'paper_id']),
+    'files': ('file_id', ['version_id']),
+    'inference_tasks': ('task_id', ['task_id', 'version_id']),
+    'feedbacks': ('feedback_id', ['feedback_id', 'version_id', 'task_id']),
+    'embeddings': ('id', ['paper_id']),
+    'version_diffs': ('diff_id', ['diff_id', 'current_version_id', 'previous_version_id']),
+}
+
+# 007 で BIGINT 化済みの主キー（downgrade でも BIGINT のまま残す）
+BIGINT_BEFORE = {('files', 'file_id'), ('embeddings', 'id')}
+
+
+def upgrade() -> None:
+    for table, (pk, columns) in TABLES.items():
+        actions = []
+        if pk:
+            actions.append(f"ALTER COLUMN {pk} DROP DEFAULT")
+        actions += [f"ALTER COLUMN {column} TYPE BIGINT" for column in columns]
+        op.execute(f"ALTER TABLE {table} " + ", ".join(actions))
+
+        if pk:
+            op.execute(f"DROP SEQUENCE IF EXISTS {table}_{pk}_seq")
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {pk} ADD GENERATED ALWAYS AS IDENTITY")
+            op.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', '{pk}'), "
+                f"COALESCE(MAX({pk}), 0) + 1, false) FROM {table}"
+            )
+
+
+def downgrade() -> None:
+    for table, (pk, columns) in reversed(TABLES.items()):
+        if pk:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {pk} DROP IDENTITY IF EXISTS")
+
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"ALTER COLUMN {column} TYPE INTEGER" for column in columns)
+        )
+
+        if pk:
+            seq_type = "BIGINT" if (table, pk) in BIGINT_BEFORE else "INTEGER"
+            op.execute(f"CREATE SEQUENCE {table}_{pk}_seq AS {seq_type} OWNED BY {table}.{pk}")
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {pk} SET DEFAULT nextval('{table}_{pk}_seq')")
+            op.execute(
+                f"SELECT setval('{table}_{pk}_seq', COALESCE(MAX({pk}), 0) + 1, false) FROM {table}"
+            )
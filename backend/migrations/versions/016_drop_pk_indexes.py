@@ -0,0 +1,43 @@
+"""Drop redundant indexes on primary key columns
+
+Revision ID: 016_drop_pk_indexes
+Revises: 015_bigint_identity
+Create Date: 2026-10-16
+
+001 で主キー列に index=True 由来の ix_*_id インデックスを作成していたが、
+主キー制約が既に一意の B-tree インデックスを持つため読み取り上の利点はなく、
+INSERT のたびに二重にインデックスを更新しているだけなので削除する。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '016_drop_pk_indexes'
+down_revision: Union[str, None] = '015_bigint_identity'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (インデックス名, テーブル, 主キー列)
+PK_INDEXES = [
+    ('ix_users_id', 'users', 'id'),
+    ('ix_papers_paper_id', 'papers', 'paper_id'),
+    ('ix_versions_version_id', 'versions', 'version_id'),
+    ('ix_files_file_id', 'files', 'file_id'),
+    ('ix_inference_tasks_task_id', 'inference_tasks', 'task_id'),
+    ('ix_feedbacks_feedback_id', 'feedbacks', 'feedback_id'),
+    ('ix_embeddings_id', 'embeddings', 'id'),
+    ('ix_version_diffs_diff_id', 'version_diffs', 'diff_id'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in PK_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in PK_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({column})")
@@ -0,0 +1,35 @@
+"""Add index on files.file_hash for duplicate upload detection
+
+Revision ID: 017_files_hash_index
+Revises: 016_drop_pk_indexes
+Create Date: 2026-10-16
+
+アップロード時に SHA-256 (file_hash) で既存ファイルを検索し、
+同一ファイルの再アップロードでは再解析を行わずに既存の論文を返す。
+その検索用のインデックス。
+
+論理削除された論文と同じファイルの再アップロードは許可するため UNIQUE にはしない。
+file_hash が NULL の旧データは検索対象外なので部分インデックスにする。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '017_files_hash_index'
+down_revision: Union[str, None] = '016_drop_pk_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_files_file_hash ON files (file_hash) "
+            "WHERE file_hash IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_files_file_hash")
@@ -0,0 +1,33 @@
+"""Add partial index on papers (created_at DESC) for the paper list
+
+Revision ID: 018_papers_active_created
+Revises: 017_files_hash_index
+Create Date: 2026-10-16
+
+論文一覧 (GET /papers/) は
+WHERE is_deleted = false ORDER BY created_at DESC で全件を取得する。
+論理削除されていない行だけを作成日時の降順で持つ部分インデックスにより、
+全件スキャン + ソートではなくインデックス順の読み出しで返せるようにする。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '018_papers_active_created'
+down_revision: Union[str, None] = '017_files_hash_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_papers_active_created ON papers (created_at DESC) "
+            "WHERE is_deleted = false"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_papers_active_created")
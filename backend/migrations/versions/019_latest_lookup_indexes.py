@@ -0,0 +1,46 @@
+"""Replace versions / inference_tasks FK indexes with latest-row composite indexes
+
+Revision ID: 019_latest_lookup_indexes
+Revises: 018_papers_active_created
+Create Date: 2026-10-16
+
+「論文の最新バージョン」「バージョンの最新タスク」の取得は
+paper_id / version_id で絞り込んだ上で version_number / created_at の降順に並べる。
+外部キー列だけの B-tree ではソートが別途必要になるため、
+(paper_id, version_number DESC) と (version_id, created_at DESC) の複合インデックスに置き換える。
+複合インデックスの先頭列で外部キーの検索・CASCADE も賄えるため、単一列のインデックスは削除する。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '019_latest_lookup_indexes'
+down_revision: Union[str, None] = '018_papers_active_created'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_versions_paper_version_number "
+            "ON versions (paper_id, version_number DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_inference_tasks_version_created "
+            "ON inference_tasks (version_id, created_at DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_versions_paper_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_inference_tasks_version_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_versions_paper_id ON versions (paper_id)")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_inference_tasks_version_id "
+            "ON inference_tasks (version_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_inference_tasks_version_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_versions_paper_version_number")
@@ -0,0 +1,34 @@
+"""Drop the unused per-owner paper listing index
+
+Revision ID: 020_drop_papers_owner_active
+Revises: 019_latest_lookup_indexes
+Create Date: 2026-10-16
+
+006 で追加した ix_papers_owner_active は owner_id で絞り込む一覧クエリが存在せず、
+どのクエリからも使われていない。
+一方で updated_at をキーに含むため、論文の更新のたびに HOT 更新が効かず
+インデックス更新が発生するため削除する。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '020_drop_papers_owner_active'
+down_revision: Union[str, None] = '019_latest_lookup_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_papers_owner_active")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_papers_owner_active "
+            "ON papers (owner_id, updated_at DESC) "
+            "INCLUDE (title, status) WHERE is_deleted = false"
+        )
@@ -0,0 +1,46 @@
+"""Seed reference users and advance the users id sequence
+
+Revision ID: 021_seed_users
+Revises: 020_drop_papers_owner_active
+Create Date: 2026-10-16
+
+初期ユーザーは SEED_USERS に列挙し、バインドパラメータで一括投入する。
+投入済みの行 (001 で作成したデモユーザーなど) は ON CONFLICT で読み飛ばす。
+ID を明示して投入するため、最後に IDENTITY のシーケンスを MAX(id) の次へ進め、
+以降に自動採番されるユーザーと衝突しないようにする。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '021_seed_users'
+down_revision: Union[str, None] = '020_drop_papers_owner_active'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# シードデータ（行を追加する場合はここに追記する）
+SEED_USERS = [
+    {'id': 1, 'email': 'demo@example.com', 'name': 'Demo User', 'role': 'STUDENT'},
+]
+
+
+def upgrade() -> None:
+    # id は GENERATED ALWAYS AS IDENTITY (015) のため、明示指定には OVERRIDING SYSTEM VALUE が必要
+    op.get_bind().execute(
+        sa.text(
+            "INSERT INTO users (id, email, name, role) OVERRIDING SYSTEM VALUE "
+            "VALUES (:id, :email, :name, :role) ON CONFLICT DO NOTHING"
+        ),
+        SEED_USERS,
+    )
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('users', 'id'), "
+        "COALESCE(MAX(id), 0) + 1, false) FROM users"
+    )
+
+
+def downgrade() -> None:
+    # シードしたユーザーは論文などから参照されている可能性があるため削除しない
+    pass
@@ -0,0 +1,123 @@
+"""
+backend テスト共通フィクスチャ
+
+PostgreSQL / Redis には接続しない。
+DBセッションは FakeSession で差し替え、Redis を使う関数はモジュール属性を monkeypatch する。
+"""
+import os
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import get_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import InferenceTask, Paper, Version  # noqa: E402
+from app.routers import papers  # noqa: E402
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+    def all(self):
+        return list(self._rows)
+
+
+class FakeSession:
+    """
+    ルーターが使う範囲だけを実装したセッション
+
+    flush 時に追加されたオブジェクトへ主キー・外部キーを採番する。
+    execute / get / scalars の戻り値はテスト側で execute_rows / objects / scalar_rows に設定する。
+    """
+
+    def __init__(self):
+        self.added = []
+        self.executed = []
+        self.execute_rows = []
+        self.scalar_rows = []
+        self.objects = {}
+        self.commits = 0
+        self.rollbacks = 0
+        self._next_id = 100
+
+    def _id(self):
+        self._next_id += 1
+        return self._next_id
+
+    def add_all(self, objs):
+        self.added.extend(objs)
+
+    def flush(self):
+        for obj in self.added:
+            if isinstance(obj, Paper) and obj.paper_id is None:
+                obj.paper_id = self._id()
+        for obj in self.added:
+            if isinstance(obj, Version) and obj.version_id is None:
+                obj.version_id = self._id()
+                obj.paper_id = obj.paper.paper_id
+        for obj in self.added:
+            if isinstance(obj, InferenceTask) and obj.task_id is None:
+                obj.task_id = self._id()
+                obj.version_id = obj.version.version_id
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+    def execute(self, stmt, params=None):
+        self.executed.append(stmt)
+        return FakeResult(self.execute_rows)
+
+    def scalars(self, stmt, params=None):
+        self.executed.append(stmt)
+        return FakeResult(self.scalar_rows)
+
+    def get(self, model, ident):
+        return self.objects.get((model, ident))
+
+
+@pytest.fixture
+def db():
+    return FakeSession()
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(papers, "_STORAGE_PATH", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def enqueued(monkeypatch):
+    """enqueue_and_notify_async の呼び出しを記録する（Redis には送らない）"""
+    calls = []
+
+    async def fake_enqueue_and_notify(paper_ids, task_ids, job_type="ANALYSIS"):
+        calls.append((list(paper_ids), list(task_ids), job_type))
+        return True
+
+    monkeypatch.setattr(papers, "enqueue_and_notify_async", fake_enqueue_and_notify)
+    return calls
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    # lifespan（マイグレーション・診断・SSEブローカー）は起動しない
+    monkeypatch.setattr(papers, "_paper_list_cache", None)
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
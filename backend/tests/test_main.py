@@ -0,0 +1,38 @@
+"""
+診断・ヘルスチェックのテスト（DB・Redis には接続しない）
+"""
+from app import main
+
+
+def _diagnostics(status):
+    return {
+        "connection": {"status": status, "message": ""},
+        "pgvector": {"status": "NG", "message": ""},
+        "tables": {"status": "NG", "message": "", "found": [], "missing": []},
+    }
+
+
+def test_failed_diagnostics_are_not_cached(monkeypatch):
+    monkeypatch.setattr(main, "_diagnostics_cache", None)
+    results = iter([_diagnostics("NG"), _diagnostics("OK")])
+    monkeypatch.setattr(main, "run_db_diagnostics", lambda: next(results))
+
+    assert main.get_cached_db_diagnostics()["connection"]["status"] == "NG"
+    # DB 復旧後の次の呼び出しでは再診断する
+    assert main.get_cached_db_diagnostics()["connection"]["status"] == "OK"
+
+
+def test_cached_diagnostics_are_copies(monkeypatch):
+    monkeypatch.setattr(main, "_diagnostics_cache", None)
+    calls = []
+
+    def run():
+        calls.append(1)
+        return _diagnostics("OK")
+
+    monkeypatch.setattr(main, "run_db_diagnostics", run)
+
+    main.get_cached_db_diagnostics()["connection"]["status"] = "changed"
+
+    assert main.get_cached_db_diagnostics()["connection"]["status"] == "OK"
+    assert len(calls) == 1
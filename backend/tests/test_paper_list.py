@@ -0,0 +1,93 @@
+"""
+論文一覧（シリアライズ済みJSONのキャッシュ）のテスト
+"""
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.models import PaperStatus, TaskStatus
+from app.routers import papers
+
+CREATED_AT = datetime(2026, 1, 2, 3, 4, 5)
+
+EXPECTED = [
+    {
+        "paper_id": 11,
+        "owner_id": 1,
+        "title": "テスト論文",
+        "status": "PROCESSING",
+        "created_at": "2026-01-02T03:04:05",
+        "latest_task_id": 41,
+        "latest_task_status": "LLM",
+        "phase": "AI分析中 (3/3)",
+    },
+    {
+        "paper_id": 12,
+        "owner_id": None,
+        "title": "タスクなし",
+        "status": "COMPLETED",
+        "created_at": None,
+        "latest_task_id": None,
+        "latest_task_status": None,
+        "phase": None,
+    },
+]
+
+
+def _rows():
+    return [
+        SimpleNamespace(
+            paper_id=11, owner_id=1, title="テスト論文", status=PaperStatus.PROCESSING,
+            created_at=CREATED_AT, task_id=41, task_status=TaskStatus.LLM,
+        ),
+        SimpleNamespace(
+            paper_id=12, owner_id=None, title="タスクなし", status=PaperStatus.COMPLETED,
+            created_at=None, task_id=None, task_status=None,
+        ),
+    ]
+
+
+def test_list_papers_shape(client, db, monkeypatch):
+    monkeypatch.setattr(papers, "get_paper_list_version", lambda: 1)
+    db.execute_rows = _rows()
+
+    response = client.get("/papers/")
+
+    assert response.status_code == 200
+    assert response.json() == EXPECTED
+
+
+def test_list_papers_served_from_cache_while_version_unchanged(client, db, monkeypatch):
+    monkeypatch.setattr(papers, "get_paper_list_version", lambda: 1)
+    db.execute_rows = _rows()
+
+    first = client.get("/papers/")
+    db.execute_rows = []
+    second = client.get("/papers/")
+
+    assert len(db.executed) == 1
+    assert second.content == first.content
+
+
+def test_list_papers_requeries_when_version_changes(client, db, monkeypatch):
+    version = {"value": 1}
+    monkeypatch.setattr(papers, "get_paper_list_version", lambda: version["value"])
+    db.execute_rows = _rows()
+    client.get("/papers/")
+
+    version["value"] = 2
+    db.execute_rows = []
+    response = client.get("/papers/")
+
+    assert len(db.executed) == 2
+    assert response.json() == []
+
+
+def test_list_papers_not_cached_without_version(client, db, monkeypatch):
+    # Redis に接続できず世代番号が取れない場合は毎回クエリする
+    monkeypatch.setattr(papers, "get_paper_list_version", lambda: None)
+    db.execute_rows = _rows()
+
+    client.get("/papers/")
+    client.get("/papers/")
+
+    assert len(db.executed) == 2
@@ -0,0 +1,91 @@
+"""
+キューサービスのテスト（Redis には接続しない）
+"""
+import asyncio
+
+import orjson
+import redis
+
+from app.services import queue_service
+
+
+class FakePipeline:
+    def __init__(self):
+        self.commands = []
+
+    def rpush(self, key, *values):
+        self.commands.append(("RPUSH", key, values))
+        return self
+
+    def incr(self, key):
+        self.commands.append(("INCR", key))
+        return self
+
+    def publish(self, channel, message):
+        self.commands.append(("PUBLISH", channel, message))
+        return self
+
+    async def execute(self):
+        return [None] * len(self.commands)
+
+
+class FakeAsyncRedis:
+    def __init__(self):
+        self.pipelines = []
+
+    def pipeline(self, transaction=True):
+        pipe = FakePipeline()
+        self.pipelines.append(pipe)
+        return pipe
+
+
+def test_enqueue_and_notify_async_sends_one_pipeline(monkeypatch):
+    client = FakeAsyncRedis()
+    monkeypatch.setattr(queue_service, "_async_redis_client", client)
+
+    assert asyncio.run(queue_service.enqueue_and_notify_async([1, 2], [10, 20]))
+
+    [pipe] = client.pipelines
+    rpush, incr, *publishes = pipe.commands
+    # worker の parse_task_data が読む形式
+    assert rpush[:2] == ("RPUSH", queue_service.TASK_QUEUE)
+    assert [orjson.loads(v) for v in rpush[2]] == [
+        {"task_id": 10, "job_type": "ANALYSIS"},
+        {"task_id": 20, "job_type": "ANALYSIS"},
+    ]
+    assert incr == ("INCR", queue_service.PAPER_LIST_VERSION_KEY)
+    assert [orjson.loads(m) for _, _, m in publishes] == [
+        {"paper_id": 1, "action": "upsert"},
+        {"paper_id": 2, "action": "upsert"},
+    ]
+
+
+def test_enqueue_and_notify_async_without_tasks_only_notifies(monkeypatch):
+    client = FakeAsyncRedis()
+    monkeypatch.setattr(queue_service, "_async_redis_client", client)
+
+    assert asyncio.run(queue_service.enqueue_and_notify_async([1], []))
+
+    assert [c[0] for c in client.pipelines[0].commands] == ["INCR", "PUBLISH"]
+
+
+class DownPipeline:
+    def ping(self):
+        return self
+
+    def llen(self, key):
+        return self
+
+    def execute(self):
+        raise redis.ConnectionError("Connection refused")
+
+
+class DownRedis:
+    def pipeline(self, transaction=True):
+        return DownPipeline()
+
+
+def test_get_queue_status_returns_degraded_when_redis_is_down(monkeypatch):
+    monkeypatch.setattr(queue_service, "get_redis_client", lambda: DownRedis())
+
+    assert queue_service.get_queue_status() == (False, 0)
@@ -0,0 +1,83 @@
+"""
+参照系レスポンスのテスト
+
+検証を省いて組み立てたレスポンスが、from_attributes で検証した場合と同じJSONになることを確認する
+"""
+from datetime import datetime
+
+from app.models import Feedback, File, FileRole, InferenceTask, Paper, PaperStatus, TaskStatus, Version
+from app.schemas import FeedbackResponse, InferenceTaskResponse, PaperDetail, VersionResponse
+
+CREATED_AT = datetime(2026, 1, 2, 3, 4, 5)
+
+
+def _paper():
+    file = File(
+        file_id=31, version_id=21, file_role=FileRole.MAIN_PDF, is_primary=True,
+        cache_path="/storage/a.pdf", is_cached=True, original_filename="a.pdf", created_at=CREATED_AT,
+    )
+    versions = [
+        Version(version_id=22, paper_id=11, version_number=2, created_at=CREATED_AT, files=[]),
+        Version(version_id=21, paper_id=11, version_number=1, created_at=CREATED_AT, files=[file]),
+    ]
+    return Paper(
+        paper_id=11, owner_id=1, title="テスト論文", status=PaperStatus.COMPLETED,
+        is_deleted=False, created_at=CREATED_AT, versions=versions,
+    )
+
+
+def test_get_paper_matches_validated_shape(client, db):
+    paper = _paper()
+    db.objects[(Paper, 11)] = paper
+
+    response = client.get("/papers/11")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body == PaperDetail.model_validate(paper).model_dump(mode="json")
+    assert body["status"] == "COMPLETED"
+    assert body["versions"][1]["files"][0]["file_role"] == "MAIN_PDF"
+
+
+def test_list_versions_matches_validated_shape(client, db):
+    paper = _paper()
+    db.objects[(Paper, 11)] = paper
+    db.scalar_rows = paper.versions
+
+    response = client.get("/papers/11/versions")
+
+    assert response.status_code == 200
+    assert response.json() == [VersionResponse.model_validate(v).model_dump(mode="json") for v in paper.versions]
+
+
+def test_get_task_matches_validated_shape(client, db):
+    task = InferenceTask(
+        task_id=41, version_id=21, status=TaskStatus.LLM, error_message=None,
+        retry_count=1, started_at=CREATED_AT, completed_at=None, created_at=CREATED_AT,
+    )
+    db.objects[(InferenceTask, 41)] = task
+
+    response = client.get("/papers/tasks/41")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body == InferenceTaskResponse.model_validate(task).model_dump(mode="json")
+    assert body["status"] == "LLM"
+
+
+def test_get_feedback_matches_validated_shape(client, db):
+    feedback = Feedback(
+        feedback_id=51, version_id=21, task_id=41,
+        score_json={"overall": 4}, comments_json={"items": ["ok"]},
+        overall_summary="要約", created_at=CREATED_AT,
+    )
+    db.scalar_rows = [feedback]
+
+    response = client.get("/papers/versions/21/feedback")
+
+    assert response.status_code == 200
+    assert response.json() == FeedbackResponse.model_validate(feedback).model_dump(mode="json")
+
+
+def test_missing_paper_returns_404(client):
+    assert client.get("/papers/999").status_code == 404
@@ -0,0 +1,231 @@
+"""
+論文アップロード（重複検出）のテスト
+"""
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models import PaperStatus, TaskStatus
+from app.routers import papers
+
+
+def _insert_files(db, rows):
+    db.inserted_files = rows
+    return list(range(1, len(rows) + 1))
+
+
+def _upload(client, content=b"%PDF-1.4 test", filename="paper.pdf"):
+    return client.post(
+        "/papers/upload",
+        data={"title": "テスト論文"},
+        files={"file": (filename, content, "application/pdf")},
+    )
+
+
+def test_find_duplicate_upload_ignores_errored_tasks(db):
+    papers.find_duplicate_upload(db, "abc")
+
+    sql = str(db.executed[-1].compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert "files.file_hash = 'abc'" in sql
+    assert "papers.is_deleted = false" in sql
+    assert "status != 'ERROR'" in sql
+
+
+def _duplicate_sql(db, is_reference):
+    papers.find_duplicate_upload(db, "abc", is_reference)
+    return str(db.executed[-1].compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_find_duplicate_upload_skips_unanalyzed_reference_papers_for_normal_uploads(db):
+    # 参考論文のタスクは開始されないまま COMPLETED で作成されるため、通常のアップロードでは再利用しない
+    sql = _duplicate_sql(db, is_reference=False)
+    assert "status != 'COMPLETED' OR anon_1.started_at IS NOT NULL" in sql
+
+    # 参考論文としてのアップロードでは、解析済みかどうかに関わらず再利用する
+    sql = _duplicate_sql(db, is_reference=True)
+    assert "started_at IS NOT NULL" not in sql
+
+
+def test_normal_upload_after_reference_upload_is_analyzed(client, db, storage, enqueued, monkeypatch):
+    lookups = []
+
+    def find_duplicate(db, file_hash, is_reference=False):
+        lookups.append(is_reference)
+        # 参考論文として登録済みの同一ファイルは、参考論文のアップロードでのみ見つかる
+        return SimpleNamespace(paper_id=1, title="参考論文", version_id=2, task_id=3) if is_reference else None
+
+    monkeypatch.setattr(papers, "find_duplicate_upload", find_duplicate)
+    monkeypatch.setattr(papers, "insert_files", _insert_files)
+
+    response = _upload(client)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["message"] == "Upload successful"
+    assert lookups == [False]
+    assert enqueued == [([body["paper_id"]], [body["task_id"]], "ANALYSIS")]
+
+
+def test_duplicate_upload_reports_unchanged_title(client, storage, enqueued, monkeypatch):
+    monkeypatch.setattr(
+        papers, "find_duplicate_upload",
+        lambda db, file_hash, is_reference=False: SimpleNamespace(
+            paper_id=1, title="既存の論文", version_id=2, task_id=3
+        ),
+    )
+
+    response = _upload(client)
+
+    assert response.json()["message"] == "Duplicate file, returning existing paper (title not changed: 既存の論文)"
+
+
+def test_upload_returns_existing_paper_for_duplicate(client, storage, enqueued, monkeypatch):
+    monkeypatch.setattr(
+        papers, "find_duplicate_upload",
+        lambda db, file_hash, is_reference=False: SimpleNamespace(
+            paper_id=1, title="テスト論文", version_id=2, task_id=3
+        ),
+    )
+
+    response = _upload(client)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["paper_id"], body["version_id"], body["task_id"]) == (1, 2, 3)
+    assert list(storage.iterdir()) == []
+    assert enqueued == []
+
+
+def test_upload_creates_paper_when_no_reusable_duplicate(client, db, storage, enqueued, monkeypatch):
+    monkeypatch.setattr(papers, "find_duplicate_upload", lambda db, file_hash, is_reference=False: None)
+    monkeypatch.setattr(papers, "insert_files", _insert_files)
+
+    response = _upload(client)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["message"] == "Upload successful"
+    assert db.commits == 1
+    [row] = db.inserted_files
+    assert row["version_id"] == body["version_id"]
+    # 一時ファイルは残らず、本来のパスに保存されている
+    saved = list(storage.iterdir())
+    assert [p.name for p in saved] == [row["cache_path"].rsplit("/", 1)[-1]]
+    assert saved[0].read_bytes() == b"%PDF-1.4 test"
+    assert enqueued == [([body["paper_id"]], [body["task_id"]], "ANALYSIS")]
+
+
+def test_upload_removes_temp_file_when_duplicate_lookup_fails(client, storage, enqueued, monkeypatch):
+    def fail(db, file_hash, is_reference=False):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(papers, "find_duplicate_upload", fail)
+
+    with pytest.raises(RuntimeError):
+        _upload(client)
+
+    assert list(storage.iterdir()) == []
+    assert enqueued == []
+
+
+def test_upload_removes_temp_file_when_rename_fails(client, storage, enqueued, monkeypatch):
+    monkeypatch.setattr(papers, "find_duplicate_upload", lambda db, file_hash, is_reference=False: None)
+
+    def fail_replace(src, dst):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(papers.os, "replace", fail_replace)
+
+    with pytest.raises(OSError):
+        _upload(client)
+
+    assert list(storage.iterdir()) == []
+    assert enqueued == []
+
+
+def _fail_enqueue(monkeypatch):
+    async def fail(paper_ids, task_ids, job_type="ANALYSIS"):
+        return False
+
+    monkeypatch.setattr(papers, "enqueue_and_notify_async", fail)
+
+
+def test_upload_marks_task_error_when_enqueue_fails(client, db, storage, monkeypatch):
+    monkeypatch.setattr(papers, "find_duplicate_upload", lambda db, file_hash, is_reference=False: None)
+    monkeypatch.setattr(papers, "insert_files", _insert_files)
+    _fail_enqueue(monkeypatch)
+
+    response = _upload(client)
+
+    assert response.status_code == 503
+    paper, _, task = db.added
+    assert task.status == TaskStatus.ERROR
+    assert paper.status == PaperStatus.ERROR
+    assert db.commits == 2
+
+
+def test_reference_upload_succeeds_when_only_notification_fails(client, db, storage, monkeypatch):
+    monkeypatch.setattr(papers, "find_duplicate_upload", lambda db, file_hash, is_reference=False: None)
+    monkeypatch.setattr(papers, "insert_files", _insert_files)
+    _fail_enqueue(monkeypatch)
+
+    response = client.post(
+        "/papers/upload",
+        data={"title": "参考論文", "is_reference": "true"},
+        files={"file": ("paper.pdf", b"%PDF-1.4 ref", "application/pdf")},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["message"] == "Reference paper registered"
+
+
+def _bulk_upload(client, *contents):
+    return client.post(
+        "/papers/bulk_upload",
+        files=[("files", (f"paper{i}.pdf", c, "application/pdf")) for i, c in enumerate(contents)],
+    )
+
+
+def test_bulk_upload_registers_identical_files_once(client, db, storage, enqueued, monkeypatch):
+    monkeypatch.setattr(papers, "find_duplicate_upload", lambda db, file_hash, is_reference=False: None)
+    monkeypatch.setattr(papers, "insert_files", _insert_files)
+
+    response = _bulk_upload(client, b"same", b"other", b"same")
+
+    assert response.status_code == 200
+    first, other, again = response.json()
+    assert first["message"] == "Upload successful"
+    assert again["message"] == "Duplicate file, returning existing paper"
+    assert (again["paper_id"], again["version_id"], again["task_id"]) == (
+        first["paper_id"], first["version_id"], first["task_id"]
+    )
+    assert other["paper_id"] != first["paper_id"]
+    assert len(db.inserted_files) == 2
+    assert sorted(p.read_bytes() for p in storage.iterdir()) == [b"other", b"same"]
+    assert enqueued == [
+        ([first["paper_id"], other["paper_id"]], [first["task_id"], other["task_id"]], "ANALYSIS")
+    ]
+
+
+def test_bulk_upload_cleans_up_saved_files_when_a_save_fails(client, db, storage, enqueued, monkeypatch):
+    monkeypatch.setattr(papers, "find_duplicate_upload", lambda db, file_hash, is_reference=False: None)
+    save = papers.save_upload_file
+    calls = []
+
+    def save_then_fail(src, path):
+        calls.append(path)
+        if len(calls) == 2:
+            with open(path, "wb") as f:
+                f.write(b"partial")
+            raise OSError("disk full")
+        return save(src, path)
+
+    monkeypatch.setattr(papers, "save_upload_file", save_then_fail)
+
+    with pytest.raises(OSError):
+        _bulk_upload(client, b"first", b"second")
+
+    assert list(storage.iterdir()) == []
+    assert db.commits == 0
+    assert enqueued == []
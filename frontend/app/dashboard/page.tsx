@@ -5,7 +5,7 @@ import Link from 'next/link';
 import { FileText, Loader2, Plus, RefreshCw, WifiOff } from 'lucide-react';
 import { getPapers } from '@/lib/api';
 import { useSSE } from '@/hooks';
-import type { Paper, TaskStatusEnum, SSENotificationEvent } from '@/types';
+import type { Paper, TaskStatusEnum, SSENotificationEvent, PaperListChangedEvent } from '@/types';
 import { getTaskStatusDisplay, getPaperStatusDisplay } from '@/types';
 
 interface PaperWithTaskInfo extends Paper {
@@ -59,6 +59,12 @@ export default function DashboardPage() {
     fetchPapers();
   }, [fetchPapers]);
 
+  // 論文の追加・削除が通知された時だけ一覧を再取得する
+  useSSE<PaperListChangedEvent>({
+    path: '/api/stream/papers',
+    onMessage: fetchPapers,
+  });
+
   if (loading) {
     return (
       <div className="flex items-center justify-center py-12">
@@ -5,24 +5,26 @@ import type { SSENotificationEvent } from '@/types';
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
-interface UseSSEOptions {
-  onMessage?: (event: SSENotificationEvent) => void;
+interface UseSSEOptions<T> {
+  path?: string;
+  onMessage?: (event: T) => void;
   onError?: (error: Event) => void;
   onOpen?: () => void;
   reconnectInterval?: number;
   maxRetries?: number;
 }
 
-interface UseSSEReturn {
+interface UseSSEReturn<T> {
   isConnected: boolean;
-  lastEvent: SSENotificationEvent | null;
+  lastEvent: T | null;
   error: string | null;
   reconnect: () => void;
   disconnect: () => void;
 }
 
-export function useSSE(options: UseSSEOptions = {}): UseSSEReturn {
+export function useSSE<T = SSENotificationEvent>(options: UseSSEOptions<T> = {}): UseSSEReturn<T> {
   const {
+    path = '/api/stream/notifications',
     onMessage,
     onError,
     onOpen,
@@ -31,7 +33,7 @@ export function useSSE(options: UseSSEOptions = {}): UseSSEReturn {
   } = options;
 
   const [isConnected, setIsConnected] = useState(false);
-  const [lastEvent, setLastEvent] = useState<SSENotificationEvent | null>(null);
+  const [lastEvent, setLastEvent] = useState<T | null>(null);
   const [error, setError] = useState<string | null>(null);
 
   const eventSourceRef = useRef<EventSource | null>(null);
@@ -44,7 +46,7 @@ export function useSSE(options: UseSSEOptions = {}): UseSSEReturn {
     }
 
     try {
-      const eventSource = new EventSource(`${API_URL}/api/stream/notifications`);
+      const eventSource = new EventSource(`${API_URL}${path}`);
       eventSourceRef.current = eventSource;
 
       eventSource.onopen = () => {
@@ -56,7 +58,7 @@ export function useSSE(options: UseSSEOptions = {}): UseSSEReturn {
 
       eventSource.onmessage = (event) => {
         try {
-          const data: SSENotificationEvent = JSON.parse(event.data);
+          const data: T = JSON.parse(event.data);
           setLastEvent(data);
           onMessage?.(data);
         } catch (e) {
@@ -84,7 +86,7 @@ export function useSSE(options: UseSSEOptions = {}): UseSSEReturn {
       setError('SSE接続の初期化に失敗しました');
       console.error('SSE initialization error:', e);
     }
-  }, [onMessage, onError, onOpen, reconnectInterval, maxRetries]);
+  }, [path, onMessage, onError, onOpen, reconnectInterval, maxRetries]);
 
   const disconnect = useCallback(() => {
     if (reconnectTimeoutRef.current) {
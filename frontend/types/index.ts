@@ -107,6 +107,11 @@ export interface SSENotificationEvent {
   error_message?: string;
 }
 
+export interface PaperListChangedEvent {
+  paper_id: number;
+  action: 'upsert' | 'delete';
+}
+
 // ================== UI Helper Types ==================
 
 export interface StatusDisplay {
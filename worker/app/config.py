@@ -1,7 +1,7 @@
 """
 MVP版 Worker設定
 """
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
 
@@ -14,8 +14,8 @@ class Settings(BaseSettings):
     mock_mode: bool = True  # デフォルトをTrue(デモモード)にする
     debug_mode: bool = False
 
-    class Config:
-        env_file = ".env"
+    # .env はプロセス起動時に get_settings() で1度だけ読み込む（以降はキャッシュ）
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", frozen=True)
 
 
 @lru_cache()
@@ -2,16 +2,19 @@
 MVP版 Database設定
 """
 from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from .config import get_settings
 
 settings = get_settings()
 
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Workerは逐次処理のためプールは既定サイズのまま、長時間アイドル後の切断対策のみ行う
+engine = create_engine(settings.database_url, pool_pre_ping=True, pool_recycle=1800)
+# expire_on_commit=False: commit後の属性アクセスで再SELECTが走らないようにする
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    pass
 
 
 def get_db():
@@ -5,8 +5,8 @@ Backend側と完全に同期（Phase 1-1対応）
 注意: このファイルは backend/app/models.py と同じ構造を維持すること
 """
 from sqlalchemy import (
-    Column, Integer, String, Text, DateTime, Boolean,
-    ForeignKey, Enum as SQLEnum, PrimaryKeyConstraint
+    Column, Integer, BigInteger, Identity, String, Text, DateTime, Boolean,
+    ForeignKey, FetchedValue, Enum as SQLEnum, PrimaryKeyConstraint, Index, text
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
@@ -17,6 +17,7 @@ from .database import Base
 
 
 # ================== Enum Definitions (Backend側と完全一致) ==================
+# DB側は PostgreSQL の ENUM 型ではなく VARCHAR(20) + CHECK 制約で保持する（migration 012）
 
 class UserRole(str, enum.Enum):
     ADMIN = "ADMIN"
@@ -26,6 +27,7 @@ class UserRole(str, enum.Enum):
 
 class FileRole(str, enum.Enum):
     MAIN_PDF = "MAIN_PDF"
+    MAIN_DOCX = "MAIN_DOCX"
     SOURCE_TEX = "SOURCE_TEX"
     ADDITIONAL_FILE = "ADDITIONAL_FILE"
 
@@ -57,10 +59,10 @@ class User(Base):
     """
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
     name = Column(String(255), nullable=False)
-    role = Column(SQLEnum(UserRole), nullable=False, default=UserRole.STUDENT)
+    role = Column(SQLEnum(UserRole, native_enum=False, create_constraint=True, length=20, name="ck_users_role"), nullable=False, default=UserRole.STUDENT)
     last_login_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
 
@@ -76,10 +78,10 @@ class Paper(Base):
     """
     __tablename__ = "papers"
 
-    paper_id = Column(Integer, primary_key=True, index=True)
-    owner_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    paper_id = Column(BigInteger, Identity(always=True), primary_key=True)
+    owner_id = Column(BigInteger, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     title = Column(String(500), nullable=False)
-    status = Column(SQLEnum(PaperStatus), nullable=False, default=PaperStatus.PROCESSING)
+    status = Column(SQLEnum(PaperStatus, native_enum=False, create_constraint=True, length=20, name="ck_papers_status"), nullable=False, default=PaperStatus.PROCESSING)
     is_deleted = Column(Boolean, nullable=False, default=False)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -89,6 +91,15 @@ class Paper(Base):
     authors = relationship("PaperAuthor", back_populates="paper", cascade="all, delete-orphan")
     versions = relationship("Version", back_populates="paper", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # 論文一覧（作成日時の降順）用。ORDER BY をインデックス順で返してソートを省く
+        Index(
+            "ix_papers_active_created",
+            created_at.desc(),
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
+
 
 class PaperAuthor(Base):
     """
@@ -96,8 +107,8 @@ class PaperAuthor(Base):
     """
     __tablename__ = "paper_authors"
 
-    paper_id = Column(Integer, ForeignKey("papers.paper_id", ondelete="CASCADE"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    paper_id = Column(BigInteger, ForeignKey("papers.paper_id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     author_order = Column(Integer, nullable=False, default=1)
     is_corresponding_author = Column(Boolean, nullable=False, default=False)
 
@@ -107,6 +118,7 @@ class PaperAuthor(Base):
 
     __table_args__ = (
         PrimaryKeyConstraint("paper_id", "user_id"),
+        Index("ix_paper_authors_user_id", "user_id"),
     )
 
 
@@ -116,8 +128,8 @@ class Version(Base):
     """
     __tablename__ = "versions"
 
-    version_id = Column(Integer, primary_key=True, index=True)
-    paper_id = Column(Integer, ForeignKey("papers.paper_id", ondelete="CASCADE"), nullable=False)
+    version_id = Column(BigInteger, Identity(always=True), primary_key=True)
+    paper_id = Column(BigInteger, ForeignKey("papers.paper_id", ondelete="CASCADE"), nullable=False)
     version_number = Column(Integer, nullable=False, default=1)
     created_at = Column(DateTime, server_default=func.now())
 
@@ -140,6 +152,11 @@ class Version(Base):
         back_populates="previous_version"
     )
 
+    __table_args__ = (
+        # 論文毎の最新バージョン取得用
+        Index("ix_versions_paper_version_number", "paper_id", version_number.desc()),
+    )
+
 
 class File(Base):
     """
@@ -147,9 +164,9 @@ class File(Base):
     """
     __tablename__ = "files"
 
-    file_id = Column(Integer, primary_key=True, index=True)
-    version_id = Column(Integer, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
-    file_role = Column(SQLEnum(FileRole), nullable=False, default=FileRole.MAIN_PDF)
+    file_id = Column(BigInteger, Identity(always=True), primary_key=True)
+    version_id = Column(BigInteger, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
+    file_role = Column(SQLEnum(FileRole, native_enum=False, create_constraint=True, length=20, name="ck_files_file_role"), nullable=False, default=FileRole.MAIN_PDF)
     is_primary = Column(Boolean, nullable=False, default=False)
     drive_file_id = Column(String(255), nullable=True)
     cache_path = Column(String(500), nullable=True)
@@ -162,6 +179,12 @@ class File(Base):
     version = relationship("Version", back_populates="files")
     embeddings = relationship("Embedding", back_populates="file", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_files_version_id", "version_id"),
+        # アップロード時の重複ファイル検出用
+        Index("ix_files_file_hash", "file_hash", postgresql_where=text("file_hash IS NOT NULL")),
+    )
+
 
 class Feedback(Base):
     """
@@ -169,9 +192,9 @@ class Feedback(Base):
     """
     __tablename__ = "feedbacks"
 
-    feedback_id = Column(Integer, primary_key=True, index=True)
-    version_id = Column(Integer, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
-    task_id = Column(Integer, ForeignKey("inference_tasks.task_id", ondelete="SET NULL"), nullable=True)
+    feedback_id = Column(BigInteger, Identity(always=True), primary_key=True)
+    version_id = Column(BigInteger, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
+    task_id = Column(BigInteger, ForeignKey("inference_tasks.task_id", ondelete="SET NULL"), nullable=True)
     score_json = Column(JSONB, nullable=True)
     comments_json = Column(JSONB, nullable=True)
     overall_summary = Column(Text, nullable=True)
@@ -181,6 +204,24 @@ class Feedback(Base):
     version = relationship("Version", back_populates="feedbacks")
     task = relationship("InferenceTask", back_populates="feedback")
 
+    __table_args__ = (
+        Index("ix_feedbacks_version_id", "version_id"),
+        Index("ix_feedbacks_task_id", "task_id"),
+        # @> 包含検索用（jsonb_path_ops は jsonb_ops より小さく高速）
+        Index(
+            "ix_feedbacks_score_json",
+            "score_json",
+            postgresql_using="gin",
+            postgresql_ops={"score_json": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_feedbacks_comments_json",
+            "comments_json",
+            postgresql_using="gin",
+            postgresql_ops={"comments_json": "jsonb_path_ops"},
+        ),
+    )
+
 
 class InferenceTask(Base):
     """
@@ -189,9 +230,9 @@ class InferenceTask(Base):
     """
     __tablename__ = "inference_tasks"
 
-    task_id = Column(Integer, primary_key=True, index=True)
-    version_id = Column(Integer, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
-    status = Column(SQLEnum(TaskStatus), nullable=False, default=TaskStatus.PENDING)
+    task_id = Column(BigInteger, Identity(always=True), primary_key=True)
+    version_id = Column(BigInteger, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
+    status = Column(SQLEnum(TaskStatus, native_enum=False, create_constraint=True, length=20, name="ck_inference_tasks_status"), nullable=False, default=TaskStatus.PENDING)
     error_message = Column(Text, nullable=True)
     retry_count = Column(Integer, nullable=False, default=0)
     conference_rule_id = Column(String(50), ForeignKey("conference_rules.rule_id", ondelete="SET NULL"), nullable=True)
@@ -204,6 +245,24 @@ class InferenceTask(Base):
     conference_rule = relationship("ConferenceRule", back_populates="inference_tasks")
     feedback = relationship("Feedback", back_populates="task", uselist=False)
 
+    __table_args__ = (
+        # バージョン毎の最新タスク取得用
+        Index("ix_inference_tasks_version_created", "version_id", created_at.desc()),
+        # 処理中タスクの取得用部分インデックス（FIFO順）
+        Index(
+            "ix_inference_tasks_status_active",
+            "status",
+            "created_at",
+            postgresql_where=text("status IN ('PENDING', 'PARSING', 'RAG', 'LLM')"),
+        ),
+        # 処理中タスクの version 単位の検索用部分インデックス
+        Index(
+            "ix_inference_tasks_version_active",
+            "version_id",
+            postgresql_where=text("status IN ('PENDING', 'PARSING', 'RAG', 'LLM')"),
+        ),
+    )
+
 
 class Embedding(Base):
     """
@@ -212,8 +271,10 @@ class Embedding(Base):
     """
     __tablename__ = "embeddings"
 
-    id = Column(Integer, primary_key=True, index=True)
-    file_id = Column(Integer, ForeignKey("files.file_id", ondelete="CASCADE"), nullable=False)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
+    file_id = Column(BigInteger, ForeignKey("files.file_id", ondelete="CASCADE"), nullable=False)
+    # file_id から DBトリガーで自動設定（論文単位のRAG絞り込み用の非正規化列）
+    paper_id = Column(BigInteger, ForeignKey("papers.paper_id", ondelete="CASCADE"), nullable=False, server_default=FetchedValue())
     chunk_index = Column(Integer, nullable=False)
     section_title = Column(String(255), nullable=True)
     page_number = Column(Integer, nullable=True)
@@ -221,12 +282,23 @@ class Embedding(Base):
     content_chunk = Column(Text, nullable=False)
     location_json = Column(JSONB, nullable=True)
     # embedding カラムは Vector 型だが、Workerでは直接操作しないため Text で代用
-    # 実際のDB上は Vector(1536) として存在
+    # 実際のDB上は halfvec(1536) として存在
     created_at = Column(DateTime, server_default=func.now())
 
     # Relationships
     file = relationship("File", back_populates="embeddings")
 
+    __table_args__ = (
+        Index("ix_embeddings_file_chunk", "file_id", "chunk_index"),
+        Index(
+            "ix_embeddings_file_page",
+            "file_id",
+            "page_number",
+            postgresql_where=text("page_number IS NOT NULL"),
+        ),
+        Index("ix_embeddings_paper_id", "paper_id"),
+    )
+
 
 class ConferenceRule(Base):
     """
@@ -244,6 +316,15 @@ class ConferenceRule(Base):
     # Relationships
     inference_tasks = relationship("InferenceTask", back_populates="conference_rule")
 
+    __table_args__ = (
+        Index(
+            "ix_conference_rules_format_rules",
+            "format_rules",
+            postgresql_using="gin",
+            postgresql_ops={"format_rules": "jsonb_path_ops"},
+        ),
+    )
+
 
 class VersionDiff(Base):
     """
@@ -251,9 +332,9 @@ class VersionDiff(Base):
     """
     __tablename__ = "version_diffs"
 
-    diff_id = Column(Integer, primary_key=True, index=True)
-    current_version_id = Column(Integer, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
-    previous_version_id = Column(Integer, ForeignKey("versions.version_id", ondelete="SET NULL"), nullable=True)
+    diff_id = Column(BigInteger, Identity(always=True), primary_key=True)
+    current_version_id = Column(BigInteger, ForeignKey("versions.version_id", ondelete="CASCADE"), nullable=False)
+    previous_version_id = Column(BigInteger, ForeignKey("versions.version_id", ondelete="SET NULL"), nullable=True)
     text_diff_json = Column(JSONB, nullable=True)
     semantic_diff_text = Column(Text, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
@@ -270,6 +351,11 @@ class VersionDiff(Base):
         back_populates="previous_diffs"
     )
 
+    __table_args__ = (
+        Index("ix_version_diffs_current_version_id", "current_version_id"),
+        Index("ix_version_diffs_previous_version_id", "previous_version_id"),
+    )
+
 
 # ================== 後方互換性のためのエイリアス ==================
 # 旧コード（Task クラス参照）との互換性のため
@@ -6,9 +6,10 @@ Phase 1-1: 新スキーマ対応版
 """
 import redis
 import time
-import json
+import orjson
 import requests
 from datetime import datetime
+from sqlalchemy import select
 
 from .config import get_settings
 from .database import get_db_session
@@ -18,12 +19,16 @@ settings = get_settings()
 
 TASK_QUEUE = "tasks"
 NOTIFICATION_CHANNEL = "task_notifications"
+# 論文一覧の世代番号（backend の一覧キャッシュを無効化する）
+PAPER_LIST_VERSION_KEY = "papers:list:sig"
 
 
 def publish_notification(task_id: int, status: str, phase: str | None = None, error_message: str | None = None):
     """
     タスク通知をRedis Pub/Subに発行
     フロントエンドのSSEに中継される
+
+    タスクの状態は論文一覧にも表示されるため、一覧の世代番号も進める
     """
     try:
         client = get_redis_client()
@@ -33,7 +38,10 @@ def publish_notification(task_id: int, status: str, phase: str | None = None, er
             "phase": phase,
             "error_message": error_message,
         }
-        client.publish(NOTIFICATION_CHANNEL, json.dumps(notification))
+        pipe = client.pipeline(transaction=False)
+        pipe.incr(PAPER_LIST_VERSION_KEY)
+        pipe.publish(NOTIFICATION_CHANNEL, orjson.dumps(notification))
+        pipe.execute()
         if settings.debug_mode:
             print(f"【デバッグ】通知発行: {notification}")
     except Exception as e:
@@ -60,8 +68,29 @@ OLLAMA_PROMPT = """以下の論文のテキストを分析し、JSON形式で回
 ## 回答（JSON形式）"""
 
 
-def get_redis_client():
-    return redis.from_url(settings.redis_url)
+_redis_client: redis.Redis | None = None
+
+
+def get_redis_client() -> redis.Redis:
+    """
+    プロセス内で共有する Redis クライアントを取得
+
+    通知発行のたびに URL解析・コネクションプール生成・TCP接続を行わないよう、
+    1つのクライアント（= 1つのコネクションプール）を使い回す
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(
+            settings.redis_url,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+    return _redis_client
+
+
+# Parser / Ollama への HTTP 呼び出しで共有するセッション
+# タスク毎に TCP 接続を張り直さず、keep-alive で接続を使い回す
+_http = requests.Session()
 
 
 def call_parser(file_path: str) -> dict:
@@ -69,7 +98,7 @@ def call_parser(file_path: str) -> dict:
     Parserサービスを呼び出してテキスト抽出
     Phase 1-2: 新形式（content, meta, pages, chunks）に対応
     """
-    response = requests.post(
+    response = _http.post(
         f"{settings.parser_url}/parse",
         json={"file_path": file_path},
         timeout=120  # ZIP/TeX処理は時間がかかる場合がある
@@ -121,7 +150,7 @@ def call_ollama(text: str) -> dict:
     # 以下、元のOllama呼び出しロジック
     prompt = OLLAMA_PROMPT.format(text=text[:10000])  # 最初の10000文字のみ
 
-    response = requests.post(
+    response = _http.post(
         f"{settings.ollama_url}/api/generate",
         json={
             "model": "gemma2:2b",
@@ -149,7 +178,7 @@ def call_ollama(text: str) -> dict:
         else:
             json_str = response_text
 
-        return json.loads(json_str)
+        return orjson.loads(json_str)
     except Exception:
         # パースに失敗した場合はそのままテキストを返す
         return {
@@ -219,7 +248,7 @@ def process_task(task_id: int):
 
     try:
         # 1. InferenceTask を取得
-        task = db.query(InferenceTask).filter(InferenceTask.task_id == task_id).first()
+        task = db.get(InferenceTask, task_id)
         if not task:
             print(f"Task {task_id} not found")
             return
@@ -233,18 +262,14 @@ def process_task(task_id: int):
             db.commit()
             return
 
-        # プライマリファイルを取得
-        primary_file = db.query(File).filter(
-            File.version_id == version.version_id,
-            File.is_primary == True
+        # プライマリファイルを取得（なければ最初のファイルを使用）
+        primary_file = db.scalars(
+            select(File)
+            .where(File.version_id == version.version_id)
+            .order_by(File.is_primary.desc().nulls_last(), File.file_id)
+            .limit(1)
         ).first()
 
-        if not primary_file:
-            # プライマリがなければ最初のファイルを使用
-            primary_file = db.query(File).filter(
-                File.version_id == version.version_id
-            ).first()
-
         if not primary_file or not primary_file.cache_path:
             print(f"No file found for version {version.version_id}")
             task.status = TaskStatus.ERROR
@@ -317,7 +342,7 @@ def process_task(task_id: int):
 
         # エラー時は即 status = ERROR
         try:
-            task = db.query(InferenceTask).filter(InferenceTask.task_id == task_id).first()
+            task = db.get(InferenceTask, task_id)
             if task:
                 task.status = TaskStatus.ERROR
                 task.error_message = str(e)
@@ -346,11 +371,9 @@ def parse_task_data(data: bytes) -> tuple:
     - Legacy format (task_id only): ("REGULAR", {"task_id": int, "job_type": "ANALYSIS"})
     """
     try:
-        decoded = data.decode("utf-8")
-
-        # Try to parse as JSON first
+        # Try to parse as JSON first (orjson は bytes をそのまま受け付ける)
         try:
-            task_data = json.loads(decoded)
+            task_data = orjson.loads(data)
             if isinstance(task_data, dict):
                 # System diagnosis task
                 if task_data.get("type") == "SYSTEM_DIAGNOSIS":
@@ -361,11 +384,11 @@ def parse_task_data(data: bytes) -> tuple:
                     if job_type == "REFERENCE_ONLY":
                         return ("REFERENCE_ONLY", task_data)
                     return ("REGULAR", task_data)
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
         # Legacy format: plain task_id number
-        task_id = int(decoded)
+        task_id = int(data)
         return ("REGULAR", {"task_id": task_id, "job_type": "ANALYSIS"})
 
     except Exception as e: